@@ -11,7 +11,6 @@
 #                  * -  Copyright © 2026 (Z) Programing  - *
 #                  *    -  -  All Rights Reserved  -  -    *
 #                  * * * * * * * * * * * * * * * * * * * * *
-import math
 from typing import Any, Dict
 
 from core.Logging import logger
@@ -27,16 +26,19 @@ class CpuIntensiveDemoTask(AbstractTask):
         self._logger = logger.bind(component='TaskSystem')
 
     def handle(self) -> None:
+        import numpy as np
         ops = self.complexity
-        reportEvery = max(ops // 20, 1)
+        # Vectorized blocks; cancellation and progress are checked once per block
+        block = min(max(ops // 20, 1), 1 << 16)
         acc = 0.0
-        for i in range(ops):
+        done = 0
+        while done < ops:
             if self.isStopped():
                 return
-            acc += math.sin(i % 360) * math.cos(i * 2 % 360)
-            if (i + 1) % reportEvery == 0:
-                pct = int((i + 1) / ops * 100)
-                self.setProgress(min(99, pct))
+            i = np.arange(done, min(done + block, ops), dtype=np.int64)
+            acc += float(np.dot(np.sin(i % 360), np.cos(i * 2 % 360)))
+            done += len(i)
+            self.setProgress(min(99, int(done / ops * 100)))
         self.result = {'acc': acc, 'ops': ops}
         self.setProgress(100)
 
@@ -30,13 +30,14 @@ class LoopDemoTask(AbstractTask):
     def handle(self) -> None:
         if self.loopCount <= 0:
             self.loopCount = 1
-        for i in range(self.loopCount):
+        total = self.loopCount
+        delay = self.delaySeconds
+        for tick in range(1, total + 1):
             if self.isStopped():
                 return
-            pct = int(((i + 1) / self.loopCount) * 100)
-            self._logger.info(f'{self.name}: iteration {i + 1}/{self.loopCount}')
-            self.setProgress(min(99, pct))
-            time.sleep(self.delaySeconds)
+            self._logger.info('{}: iteration {}/{}', self.name, tick, total)
+            self.setProgress(min(99, tick * 100 // total))
+            time.sleep(delay)
         self.setProgress(100)
         self.result = {'iterations': self.loopCount}
 
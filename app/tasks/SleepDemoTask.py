@@ -28,12 +28,12 @@ class SleepDemoTask(AbstractTask):
 
     def handle(self) -> None:
         total = self.durationSeconds
-        for i in range(total):
+        # Fixed tick count: no clock reads or float math per interval
+        for tick in range(1, total + 1):
             if self.isStopped():
                 return
-            pct = int(((i + 1) / total) * 100)
-            self._logger.info(f'{self.name}: sleeping {i + 1}/{total}s')
-            self.setProgress(min(99, pct))
+            self._logger.info('{}: sleeping {}/{}s', self.name, tick, total)
+            self.setProgress(min(99, tick * 100 // total))
             time.sleep(1.0)
         self.setProgress(100)
         self.result = {'sleptSeconds': total}
@@ -46,6 +46,7 @@ class MainController(Ui_MainWindow, BaseController, QMainWindow):
         self.taskManager = ctx.taskManager
         self.taskProgress = {}
         super().__init__(parent)
+        ctx.registerMainWindow(self)
         self.setupSignalHandlers()
         self.updateTimer = QTimer(self)
         self.updateTimer.timeout.connect(self.updateAll)
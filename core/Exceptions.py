@@ -77,6 +77,8 @@ class ExceptionHandler:
         """Handle an exception"""
         if isinstance(e, self._excludes):
             return False
+        if not self._error_handlers:
+            return self._default_handler(e)
         handler = None
         for exc_type, h in self._error_handlers.items():
             if isinstance(e, exc_type):
@@ -93,17 +95,10 @@ class ExceptionHandler:
         from PySide6.QtCore import QThread, QTimer
         from .Logging import logger
         from .Utils import WidgetUtils
-        # Log the exception first
-        if isinstance(e, AppException):
-            logger.exception('App exception')
-            logger.opt(exception=e).error(str(e))
-            error_msg = str(e)
-            error_title = e.title
-        else:
-            logger.exception('Unhandled exception', e)
-            logger.opt(exception=e).error(str(e))
-            error_msg = str(e)
-            error_title = 'Unhandled Error'
+        error_msg = str(e)
+        error_title = e.title if isinstance(e, AppException) else 'Unhandled Error'
+        # Log the exception first (single record, traceback attached via opt)
+        logger.opt(exception=e).error('{}: {}', error_title, error_msg)
         # Show messageBox only if we have a QApplication instance
         try:
             app = QApplication.instance()
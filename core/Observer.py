@@ -185,7 +185,12 @@ class Publisher:
         if slot is None:
             self._logger.error(f"Signal '{signalName}' not found on widget '{widget.__class__.__name__}'")
             return self
-        slot.connect(lambda *sArgs, **sKwargs: self.notify(event, *[*args, *sArgs], **{**kwargs, **sKwargs}))
+        if not args and not kwargs:
+            slot.connect(lambda *sArgs: self.notify(event, *sArgs))
+            return self
+        prefix = tuple(args)
+        baseKwargs = dict(kwargs)
+        slot.connect(lambda *sArgs, **sKwargs: self.notify(event, *prefix, *sArgs, **(baseKwargs if not sKwargs else {**baseKwargs, **sKwargs})))
         return self
 
     def stop(self) -> None:
@@ -11,9 +11,13 @@
 #                  * -  Copyright © 2026 (Z) Programing  - *
 #                  *    -  -  All Rights Reserved  -  -    *
 #                  * * * * * * * * * * * * * * * * * * * * *
+import heapq
 import os
 import sys
-from typing import Any, Optional, Self, Union, Type, TypeVar
+import threading
+import weakref
+from concurrent.futures import Future
+from typing import Any, Callable, Optional, Self, Union, Type, TypeVar
 
 T = TypeVar('T')
 
@@ -28,6 +32,10 @@ try:
     from dotenv import load_dotenv
 except ImportError:
     load_dotenv = None
+try:
+    import qdarktheme
+except ImportError:
+    qdarktheme = None
 from PySide6.QtCore import QCoreApplication, QMutex, QMutexLocker, QObject, QTimer, Signal, Slot
 from PySide6.QtWidgets import QApplication
 
@@ -38,34 +46,62 @@ from core.NetworkManager import NetworkManager
 from core.Observer import Publisher
 from core.ServiceLocator import ServiceLocator
 
+_FEATURE_KEY_MAP = {'network': 'ENABLE_NETWORK', 'tasks': 'ENABLE_TASKS'}
+_ENV_PREFIX = 'PSA_'
+_TRUE_SET = frozenset(('true', '1', 'yes', 'on', 'y', 't'))
+
+
+_MainController: Optional[type] = None
+_mainControllerResolved = False
+
+
+def _resolveMainControllerCls() -> Optional[type]:
+    """Lazy-import the app's MainController once; None if the app does not ship one."""
+    global _MainController, _mainControllerResolved
+    if not _mainControllerResolved:
+        try:
+            from app.windows.main.MainController import MainController as _MainController
+        except ImportError:
+            _MainController = None
+        _mainControllerResolved = True
+    return _MainController
+
+
+def _parseEnvBool(val: str) -> bool:
+    if val in ('1', '0'):
+        return val == '1'
+    return val.lower() in _TRUE_SET
+
 
 class QtAppContext(QObject):
     """
     Central Application Context.
     Manages Lifecycle, Feature Flags, Services, and Scoped Resources.
+
+    Shared state: single-key ``dict.get`` / ``dict[k] = v`` are atomic, so
+    ``getState`` reads without locking; writes are serialized by a plain
+    ``threading.Lock`` to stay safe on free-threaded builds.
     """
 
     _initialized = False
+    # Process-once guard: .env / snapshot is merged into os.environ at most once
+    _dotenvLoaded = False
     appBooting = Signal()
     appReady = Signal()
     appClosing = Signal()
     _instance: 'QtAppContext' = None
-    _lock = QMutex()
 
     @classmethod
     def globalInstance(cls) -> 'QtAppContext':
-        if cls._instance is None:
-            with QMutexLocker(cls._lock):
-                if cls._instance is None:
-                    cls._instance = cls()
-        return cls._instance
+        return _Holder.INSTANCE
 
     @staticmethod
     def _ensurePyPath():
         """Setup environment variables and paths"""
-        projectRoot = PathHelper.rootDir()
-        sys.path.append(str(projectRoot))
-        os.environ['QT_AUTO_SCREEN_SCALE_FACTOR'] = '1'
+        projectRoot = str(PathHelper.rootDir())
+        if projectRoot not in sys.path:
+            sys.path.append(projectRoot)
+        os.environ.setdefault('QT_AUTO_SCREEN_SCALE_FACTOR', '1')
 
     def __new__(cls):
         if cls._instance is None:
@@ -82,9 +118,12 @@ class QtAppContext(QObject):
         self._isBootstrapped = False
         self._isServiceProviderRegistered = False
         self.loop = None  # qasync QEventLoop, set during bootstrap()
-        self._bootstrapLock = QMutex()
+        # One Future per bootstrap attempt: waiters block on it and see its success or failure
+        self._bootLock = threading.Lock()
+        self._bootFuture: Optional[Future] = None
+        self._bootThreadId: Optional[int] = None
         self._sharedState: dict[str, Any] = {}
-        self._stateLock = QMutex()
+        self._stateWriteLock = threading.Lock()
         self._sharedCollections: dict[str, SharedCollection] = {}
         self._collectionLock = QMutex()
         self._services = ServiceLocator()
@@ -92,26 +131,67 @@ class QtAppContext(QObject):
         self._publisher: Optional[Publisher] = None
         self._networkManager: Optional[NetworkManager] = None
         self._taskManager = None
+        # Primed from the current process env; re-primed after .env is loaded in bootstrap
+        self._envBoolCache: dict[str, bool] = {}
+        self._prime_env_cache()
+        self._mainWindowRef: Optional[weakref.ref] = None
+        self._themeSettings: Optional[tuple[bool, str]] = None
+        self._bootErrors: list[tuple[str, str]] = []  # (title, message) collected during bootstrap
         self._app.aboutToQuit.connect(self._onExit)
 
+    @staticmethod
+    def _isEnvSnapshotStale(snapshotFile: str) -> bool:
+        """True when the project .env was modified after the snapshot was written."""
+        try:
+            envMtime = os.stat(os.path.join(PathHelper.rootDir(), '.env')).st_mtime
+        except OSError:
+            # No .env (e.g. packaged build): the snapshot is the only source
+            return False
+        try:
+            return envMtime > os.stat(snapshotFile).st_mtime
+        except (OSError, TypeError):
+            # Snapshot has no stat-able source file (frozen build): trust it
+            return False
+
     def _load_environment(self) -> Self:
-        """Load .env file and setup environment variables."""
-        if load_dotenv:
+        """Load .env file and setup environment variables.
+        Prefers the build-time snapshot (scripts/compile_env.py); falls back to
+        parsing .env with python-dotenv when no snapshot exists (dev mode) or when
+        .env was edited after the snapshot was generated.
+        Existing process variables always win, as with load_dotenv().
+        """
+        if QtAppContext._dotenvLoaded:
+            return self._prime_env_cache()
+        try:
+            from app import _env_snapshot
+            ENV_SNAPSHOT = _env_snapshot.ENV_SNAPSHOT
+        except ImportError:
+            ENV_SNAPSHOT = None
+        if ENV_SNAPSHOT is not None and self._isEnvSnapshotStale(_env_snapshot.__file__):
+            logger.warning('.env is newer than app/_env_snapshot.py — reading .env (run: pixi run compile-env)')
+            ENV_SNAPSHOT = None
+        if ENV_SNAPSHOT is not None:
+            os.environ.update({k: v for k, v in ENV_SNAPSHOT.items() if k not in os.environ})
+        elif load_dotenv:
             load_dotenv()
+        QtAppContext._dotenvLoaded = True
+        return self._prime_env_cache()
+
+    def _prime_env_cache(self) -> Self:
+        """Snapshot all PSA_ env vars once, parsed to bool and keyed without the prefix."""
+        prefixLen = len(_ENV_PREFIX)
+        self._envBoolCache = {key[prefixLen:]: _parseEnvBool(val) for key, val in os.environ.items() if key.startswith(_ENV_PREFIX)}
         return self
 
     def _get_env_bool(self, key: str, default: bool = True) -> bool:
         """Helper to parse boolean env vars (PSA_ prefix)."""
-        val = os.getenv(f'PSA_{key}')
-        if val is None:
-            return default
-        return val.lower() in ('true', '1', 'yes', 'on')
+        return self._envBoolCache.get(key, default)
 
     def _setupAppNameIcon(self) -> Self:
         from core.Utils import AppHelper
         app_name = AppHelper.getAppName()
         app_version = AppHelper.getAppVersion()
-        self._app.setApplicationName(f'{app_name}')
+        self._app.setApplicationName(app_name)
         self._app.setApplicationVersion(app_version)
         self._app.setOrganizationName('Z-Programming')
         self._app.setOrganizationDomain('zuko.pro')
@@ -120,77 +200,120 @@ class QtAppContext(QObject):
 
     def isFeatureEnabled(self, feature_name: str) -> bool:
         """Check if a specific feature is enabled via env vars."""
-        keyMap = {'network': 'ENABLE_NETWORK', 'tasks': 'ENABLE_TASKS'}
-        envKey = keyMap.get(feature_name.lower())
+        # Exact-key hit first — callers pass lowercase names, so .lower() is only paid on a miss
+        envKey = _FEATURE_KEY_MAP.get(feature_name) or _FEATURE_KEY_MAP.get(feature_name.lower())
         if not envKey:
             return True
         return self._get_env_bool(envKey, default=True)
 
     def _setupTheme(self) -> Self:
         """Setup theme"""
-        import qdarktheme
-        config = self.config()
-        if config.get('ui.high_dpi', True):
+        if qdarktheme is None:
+            logger.warning('qdarktheme not installed — skipping theme setup')
+            return self
+        if self._themeSettings is None:
+            config = self._config
+            self._themeSettings = (config.get('ui.high_dpi', True), config.get('ui.theme', 'auto'))
+        highDpi, theme = self._themeSettings
+        if highDpi:
             qdarktheme.enable_hi_dpi()
-        qdarktheme.setup_theme(config.get('ui.theme', 'auto'))
+        qdarktheme.setup_theme(theme)
         return self
 
     def bootstrap(self) -> Self:
         """
         Initialize the application context.
         Thread-safe and Idempotent (Runs only once).
+        Only the first caller runs the initialization; concurrent callers block
+        until that attempt finishes. If it fails, they re-raise its exception,
+        and the next bootstrap() call starts a fresh attempt.
         """
-        with QMutexLocker(self._bootstrapLock):
-            if self._isBootstrapped:
-                logger.warning('QtAppContext is already bootstrapped. Skipping.')
-                return
-            # ── Bootstrap-begin diagnostics ───────────────────────────────────
-            import faulthandler
-            faulthandler.enable()  # C-level crash dumps (SIGSEGV / SIGABRT) → stderr
-            try:
-                from typeguard import install_import_hook
-                install_import_hook('core')
-                logger.debug('typeguard import hook installed for namespace: core')
-            except ImportError:
-                logger.warning('typeguard not installed — runtime type checking disabled for core namespace')
-            logger.info('Bootstrapping Application Context...')
-            self.appBooting.emit()
-            self._load_environment()
-            import asyncio
-            from qasync import QEventLoop
-            self.loop = QEventLoop(self._app)
-            asyncio.set_event_loop(self.loop)
-            self._config = Config()
-            self.registerService('config', self._config)
-            self._publisher = Publisher.instance()
-            self.registerService('publisher', self._publisher)
-            try:
-                ExceptionHandler.setupGlobalHandler()
-                logger.info('Global Exception Handler installed.')
-            except Exception as e:
-                logger.error(f'Failed to install ExceptionHandler: {e}')
-            if self.isFeatureEnabled('network'):
-                logger.info('Feature [Network]: ENABLED')
-                self._networkManager = NetworkManager(self._config)
-                self.registerService('network', self._networkManager)
-            else:
-                logger.warning('Feature [Network]: DISABLED (via PSA_ENABLE_NETWORK)')
-            if self.isFeatureEnabled('tasks'):
-                logger.info('Feature [Tasks]: ENABLED')
-                from core.taskSystem.TaskManagerService import TaskManagerService
-                self._taskManager = TaskManagerService(self._publisher, self._config)
-                self.registerService('taskManager', self._taskManager)
+        with self._bootLock:
+            future = self._bootFuture
+            if future is None or (future.done() and future.exception() is not None):
+                # First call, or the previous attempt failed: this caller runs a new one
+                future = self._bootFuture = Future()
+                self._bootThreadId = threading.get_ident()
+                isRunner = True
             else:
-                logger.warning('Feature [Tasks]: DISABLED (via PSA_ENABLE_TASKS)')
-            self._setupTheme()._setupAppNameIcon()
-            self._isBootstrapped = True
-            self._loadAppProviders()
-            self._publisher.notify('app.ready')
-            self.appReady.emit()
-            self._schedulePostBootInit()
-            self._isServiceProviderRegistered = True
-            logger.info('Application Context Ready.')
+                isRunner = False
+        if not isRunner:
+            # Re-entrant call from the booting thread must not wait on itself
+            if not future.done() and self._bootThreadId != threading.get_ident():
+                future.result()  # re-raises if the attempt we waited on failed
+            logger.warning('QtAppContext is already bootstrapped. Skipping.')
             return self
+        try:
+            self._runBootstrap()
+        except BaseException as e:
+            self._bootThreadId = None
+            future.set_exception(e)
+            raise
+        future.set_result(None)
+        return self
+
+    def _runBootstrap(self) -> None:
+        # ── Bootstrap-begin diagnostics ───────────────────────────────────
+        import faulthandler
+        faulthandler.enable()  # C-level crash dumps (SIGSEGV / SIGABRT) → stderr
+        try:
+            from typeguard import install_import_hook
+            install_import_hook('core')
+            logger.debug('typeguard import hook installed for namespace: core')
+        except ImportError:
+            logger.warning('typeguard not installed — runtime type checking disabled for core namespace')
+        logger.info('Bootstrapping Application Context...')
+        self.appBooting.emit()
+        self._load_environment()
+        import asyncio
+        from qasync import QEventLoop
+        self.loop = QEventLoop(self._app)
+        asyncio.set_event_loop(self.loop)
+        self._config = Config()
+        self._publisher = Publisher.instance()
+        # Core services are published together below (one ServiceLocator lock round-trip)
+        pendingServices = {'config': self._config, 'publisher': self._publisher}
+        try:
+            ExceptionHandler.setupGlobalHandler()
+            logger.info('Global Exception Handler installed.')
+        except Exception as e:
+            logger.error('Failed to install ExceptionHandler: {}', e)
+        if self.isFeatureEnabled('network'):
+            logger.info('Feature [Network]: ENABLED')
+            # Deferred: QNetworkAccessManager + disk cache are built on first getService('network')
+            self.registerServiceFactory('network', self._createNetworkManager)
+        else:
+            logger.warning('Feature [Network]: DISABLED (via PSA_ENABLE_NETWORK)')
+        if self.isFeatureEnabled('tasks'):
+            logger.info('Feature [Tasks]: ENABLED')
+            from core.taskSystem.TaskManagerService import TaskManagerService
+            self._taskManager = TaskManagerService(self._publisher, self._config)
+            pendingServices['taskManager'] = self._taskManager
+        else:
+            logger.warning('Feature [Tasks]: DISABLED (via PSA_ENABLE_TASKS)')
+        self._services.registerMany(pendingServices)
+        self._setupTheme()._setupAppNameIcon()
+        self._isBootstrapped = True
+        self._loadAppProviders()
+        self._publisher.notify('app.ready')
+        self.appReady.emit()
+        if self._bootErrors:
+            QTimer.singleShot(0, self._flushBootErrors)
+        self._schedulePostBootInit()
+        self._isServiceProviderRegistered = True
+        logger.info('Application Context Ready.')
+
+    def _flushBootErrors(self) -> None:
+        """Show bootstrap errors in one message box, off the boot path."""
+        from core.Utils import WidgetUtils
+        errors, self._bootErrors = self._bootErrors, []
+        if not errors:
+            return
+        if len(errors) == 1:
+            title, msg = errors[0]
+        else:
+            title, msg = 'Provider Errors', '\n\n'.join(f'[{t}] {m}' for t, m in errors)
+        WidgetUtils.showAlertMsgBox(None, title=title, msg=msg)
 
     def _schedulePostBootInit(self) -> None:
         """Schedule heavy subsystem init for next event loop tick (post-boot)."""
@@ -208,49 +331,88 @@ class QtAppContext(QObject):
         if not PROVIDERS:
             return
         import importlib
+        import importlib.util
+        from concurrent.futures import ThreadPoolExecutor
         from core.contracts.ServiceProvider import ServiceProvider
-        from core.Utils import WidgetUtils
         # --- Phase 0: Import and instantiate ---
+        # Module imports run in parallel (the GIL is released on .pyc reads);
+        # class resolution and validation stay on the main thread, in manifest order.
         providerInstances = {}  # className -> instance
         providerClasses = {}  # className -> class
-        for fqn in PROVIDERS:
-            modulePath, className = fqn.rsplit('.', 1)
+        providerDeps = {}  # className -> frozenset of dependency names
+        importable = []  # (modulePath, className, deps) — deps is None when unvalidated
+        for entry in PROVIDERS:
+            if isinstance(entry, str):
+                # Legacy 'module.Class' entry: validated and deps resolved at runtime
+                modulePath, className = entry.rsplit('.', 1)
+                deps = None
+            else:
+                modulePath, className, deps = entry
             try:
-                mod = importlib.import_module(modulePath)
-                cls = getattr(mod, className)
-                if not (isinstance(cls, type) and issubclass(cls, ServiceProvider)):
-                    logger.warning(f'[Providers] {fqn} is not a ServiceProvider subclass, skipping.')
-                    continue
-                providerClasses[className] = cls
+                spec = importlib.util.find_spec(modulePath)
+            except ModuleNotFoundError:
+                spec = None
             except Exception as e:
-                msg = f'Failed to import provider {fqn}: {e}'
-                logger.error(f'[Providers] {msg}')
-                WidgetUtils.showAlertMsgBox(None, msg, 'Provider Import Error')
+                # find_spec imports the parent package of a dotted path; its failures are real import errors
+                msg = f'Failed to import provider {modulePath}.{className}: {e}'
+                logger.error('[Providers] {}', msg)
+                self._bootErrors.append(('Provider Import Error', msg))
+                continue
+            if spec is None:
+                # Cheap spec probe — avoids building an ImportError traceback for stale manifest entries
+                logger.warning('[Providers] Module {} not found (stale manifest?), skipping {}.{}.', modulePath, modulePath, className)
+                continue
+            importable.append((modulePath, className, deps))
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(importable))), thread_name_prefix='ProviderImport') as pool:
+            importFutures = [(item, pool.submit(importlib.import_module, item[0])) for item in importable]
+        for (modulePath, className, deps), future in importFutures:
+            try:
+                try:
+                    cls = getattr(future.result(), className)
+                except Exception:
+                    # Provider modules importing each other can see a partially initialized module
+                    # in a parallel import; retry serially so only real, repeatable failures are reported.
+                    cls = getattr(importlib.import_module(modulePath), className)
+            except Exception as e:
+                msg = f'Failed to import provider {modulePath}.{className}: {e}'
+                logger.error('[Providers] {}', msg)
+                self._bootErrors.append(('Provider Import Error', msg))
+                continue
+            # Re-checked for tuple entries too: a stale manifest may name a class that is no longer a provider
+            if not (isinstance(cls, type) and issubclass(cls, ServiceProvider)):
+                logger.warning('[Providers] {}.{} is not a ServiceProvider subclass, skipping.', modulePath, className)
+                continue
+            if deps is None:
+                # Legacy 'module.Class' entry: deps come from the class rather than the manifest
+                deps = cls._allDeps
+            className = sys.intern(className)
+            providerClasses[className] = cls
+            providerDeps[className] = deps
         # --- Phase 1: Topological sort (Kahn's algorithm) ---
         # Build graph: after + requires + wants all contribute edges
         inDegree = {name: 0 for name in providerClasses}
         graph = {name: [] for name in providerClasses}  # name -> list of dependents
-        for name, cls in providerClasses.items():
-            deps = set(getattr(cls, 'after', []) + getattr(cls, 'requires', []) + getattr(cls, 'wants', []))
+        for name, deps in providerDeps.items():
             for dep in deps:
                 if dep in providerClasses:
                     graph[dep].append(name)
                     inDegree[name] += 1
+        # Min-heap keeps the lexical (deterministic) order without re-sorting every step
         queue = [n for n in providerClasses if inDegree[n] == 0]
+        heapq.heapify(queue)
         sortedNames = []
         while queue:
-            queue.sort()  # deterministic order
-            node = queue.pop(0)
+            node = heapq.heappop(queue)
             sortedNames.append(node)
             for dependent in graph[node]:
                 inDegree[dependent] -= 1
                 if inDegree[dependent] == 0:
-                    queue.append(dependent)
+                    heapq.heappush(queue, dependent)
         if len(sortedNames) != len(providerClasses):
             cycle = set(providerClasses) - set(sortedNames)
             msg = f'Circular dependency detected among providers: {cycle}'
-            logger.error(f'[Providers] {msg}')
-            WidgetUtils.showAlertMsgBox(None, title='Provider Dependency Error', msg=msg)
+            logger.error('[Providers] {}', msg)
+            self._bootErrors.append(('Provider Dependency Error', msg))
             # Still load what we can
             for name in providerClasses:
                 if name not in sortedNames:
@@ -260,52 +422,61 @@ class QtAppContext(QObject):
         for name in sortedNames:
             cls = providerClasses[name]
             # Check requires
-            requiredDeps = getattr(cls, 'requires', [])
-            missingReqs = [r for r in requiredDeps if r in failedProviders]
+            missingReqs = sorted(cls._requiredDeps & failedProviders)
             if missingReqs:
-                logger.warning(f'[Providers] Skipping {name}: required providers failed: {missingReqs}')
+                logger.warning('[Providers] Skipping {}: required providers failed: {}', name, missingReqs)
                 failedProviders.add(name)
                 continue
             try:
                 instance = cls(self)
                 instance.register()
                 providerInstances[name] = instance
-                logger.info(f'[Providers] ✓ Registered: {name}')
+                logger.info('[Providers] ✓ Registered: {}', name)
             except Exception as e:
                 failedProviders.add(name)
                 msg = f'Provider {name}.register() failed: {e}'
-                logger.error(f'[Providers] {msg}')
-                WidgetUtils.showAlertMsgBox(None, title='Provider Registration Error', msg=msg)
+                logger.error('[Providers] {}', msg)
+                self._bootErrors.append(('Provider Registration Error', msg))
         # --- Phase 3: boot() ---
-        for name in sortedNames:
-            instance = providerInstances.get(name)
-            if not instance:
-                continue
+        # Kept as a separate pass: the ServiceProvider contract runs boot() only after *all*
+        # register() calls. providerInstances is filled in sorted order, so iterate it directly.
+        for name, instance in providerInstances.items():
             try:
                 instance.boot()
                 self._timeoutUtilBootstrapped(instance)
             except Exception as e:
                 msg = f'Provider {name}.boot() failed: {e}'
-                logger.error(f'[Providers] {msg}')
-                WidgetUtils.showAlertMsgBox(None, title='Provider Boot Error', msg=msg)
-        logger.info(f'[Providers] Loaded {len(providerInstances)}/{len(PROVIDERS)} providers.')
+                logger.error('[Providers] {}', msg)
+                self._bootErrors.append(('Provider Boot Error', msg))
+        logger.info('[Providers] Loaded {}/{} providers.', len(providerInstances), len(PROVIDERS))
 
     def _timeoutUtilBootstrapped(self, serviceInstance):
         if not self._isServiceProviderRegistered:
             QTimer.singleShot(500, lambda: self._timeoutUtilBootstrapped(serviceInstance))
             return
-        print(serviceInstance)
         if hasattr(serviceInstance, 'booted'):
-            try:
-                serviceInstance.booted()
-            except:
-                raise
+            serviceInstance.booted()
+
+    def registerMainWindow(self, controller) -> Self:
+        """Remember the main window controller (weakly) for O(1) getMainWindowCtl()."""
+        self._mainWindowRef = weakref.ref(controller)
+        return self
 
     def getMainWindowCtl(self):
-        for widget in self._app.topLevelWidgets():
-            if type(widget).__name__ == 'MainController':
-                return widget
-        return None
+        ref = self._mainWindowRef
+        if ref is not None:
+            controller = ref()
+            if controller is not None:
+                return controller
+        mainCls = _resolveMainControllerCls()
+        if mainCls is not None:
+            # MRO membership rather than isinstance(): ControllerMeta's ABCMeta hook breaks on controllers
+            widget = next((w for w in self._app.topLevelWidgets() if mainCls in type(w).__mro__), None)
+        else:
+            widget = next((w for w in self._app.topLevelWidgets() if type(w).__name__ == 'MainController'), None)
+        if widget is not None:
+            self._mainWindowRef = weakref.ref(widget)
+        return widget
 
     def run(self) -> int:
         """Start the qasync event loop (replaces QApplication.exec())."""
@@ -337,6 +508,19 @@ class QtAppContext(QObject):
             self._services.register(nameOrInstance, instance)
         return self
 
+    def registerServiceFactory(self, nameOrType: Union[str, Type], factory: Callable[[], Any]) -> 'Self':
+        """Register a lazily constructed global service (built on first getService)."""
+        self._services.registerFactory(nameOrType, factory)
+        return self
+
+    def _createNetworkManager(self) -> NetworkManager:
+        networkManager = NetworkManager(self._config)
+        if networkManager.thread() != self._app.thread():
+            # First access may come from a worker; keep the QObject on the GUI thread
+            networkManager.moveToThread(self._app.thread())
+        self._networkManager = networkManager
+        return networkManager
+
     def getService(self, nameOrType: Union[str, Type[T]], default: Any = None) -> Optional[T]:
         """Get a registered service by string key or class."""
         return self._services.get(nameOrType, default)
@@ -366,8 +550,9 @@ class QtAppContext(QObject):
     @property
     def network(self) -> Optional[QNetworkAccessManager]:
         """Returns QNetworkAccessManager or None if disabled."""
-        if self._networkManager:
-            return self._networkManager.manager
+        networkManager = self._networkManager or self.getService('network')
+        if networkManager:
+            return networkManager.manager
         logger.warning("Accessing 'network' but feature is disabled or not initialized.")
         return None
 
@@ -380,13 +565,17 @@ class QtAppContext(QObject):
         return None
 
     def setState(self, key: str, value: Any) -> 'QtAppContext':
-        with QMutexLocker(self._stateLock):
+        with self._stateWriteLock:
             self._sharedState[key] = value
         return self
 
     def getState(self, key: str, default: Any = None) -> Any:
-        with QMutexLocker(self._stateLock):
-            return self._sharedState.get(key, default)
+        return self._sharedState.get(key, default)
+
+    def getStateSnapshot(self) -> dict[str, Any]:
+        """Consistent shallow copy of all shared state, for composite (multi-key) reads."""
+        with self._stateWriteLock:
+            return dict(self._sharedState)
 
     # ------------------------------------------------------------------
     # SharedCollection management
@@ -419,3 +608,31 @@ class QtAppContext(QObject):
     @property
     def app(self):
         return self._app
+
+
+class _LazyInstance:
+    """Non-data descriptor that builds the context on first read, then replaces itself."""
+
+    _initLock = threading.Lock()
+
+    def __get__(self, obj, owner) -> QtAppContext:
+        # Only the very first reads reach here; later ones hit the plain class attribute
+        with self._initLock:
+            instance = owner.__dict__['INSTANCE']
+            if instance is self:
+                instance = QtAppContext()
+                owner.INSTANCE = instance
+        return instance
+
+
+class _Holder:
+    """Initialization-on-demand holder: after the first read INSTANCE is a plain class attribute."""
+
+    INSTANCE: QtAppContext = _LazyInstance()
+
+
+def __getattr__(name: str):
+    # PEP 562: expose the lazily created singleton as a module attribute
+    if name == '_SINGLETON':
+        return _Holder.INSTANCE
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
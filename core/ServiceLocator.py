@@ -11,9 +11,9 @@
 #                  * -  Copyright © 2026 (Z) Programing  - *
 #                  *    -  -  All Rights Reserved  -  -    *
 #                  * * * * * * * * * * * * * * * * * * * * *
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple, Type, TypeVar, Union, get_type_hints
 
-from PySide6.QtCore import QMutex, QMutexLocker, QObject
+from PySide6.QtCore import QMutex, QMutexLocker, QObject, QRecursiveMutex
 
 from core.Logging import logger
 
@@ -21,6 +21,8 @@ T = TypeVar('T')
 
 # Sentinel to distinguish "no instance passed" from None
 _SENTINEL = object()
+# releaseScope cleanup priority
+_DISPOSER_NAMES = ('cleanup', 'close', 'dispose')
 
 
 class ServiceLocator(QObject):
@@ -28,22 +30,43 @@ class ServiceLocator(QObject):
     Advanced Dependency Injection & Lifecycle Manager.
     Supports:
     1. Global Singletons  – keyed by string or class FQN
-    2. Scoped Instances   – tag-based grouping & auto-cleanup
+    2. Lazy Singletons    – factory run on first get(), then cached as a singleton
+    3. Scoped Instances   – tag-based grouping & auto-cleanup
+    Singleton reads are lock-free; every mutation goes through self._lock.
     """
 
     def __init__(self):
         super().__init__()
         # Global singletons: { key_str: instance }
+        # Copy-on-write: writers rebind a fresh dict under the lock, readers never lock
         self._singletons: Dict[str, Any] = {}
         self._backCompatibleMaps: Dict[str, str] = {}
-        # Scoped instances: { 'tag_id': [instance1, instance2, ...] }
-        self._scopes: Dict[str, List[Any]] = {}
+        # Lazy singletons: { key_str: factory } — popped once the instance is built
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        # Recursive: a factory may itself resolve other lazy services
+        self._factoryLock = QRecursiveMutex()
+        # Scoped instances: { 'tag_id': ([instance1, instance2, ...], {id(instance1), ...}) }
+        # The id() set is an O(1) membership sidecar; ids stay valid while the list holds the objects
+        self._scopes: Dict[str, Tuple[List[Any], Set[int]]] = {}
+        # Disposer method name per type, resolved once: { cls: 'cleanup' | 'close' | 'dispose' | None }
+        self._disposerCache: Dict[type, Optional[str]] = {}
         self._lock = QMutex()
 
     # =========================================================================
     # INTERNAL HELPERS
     # =========================================================================
 
+    def _resolveDisposer(self, instance: Any) -> Optional[str]:
+        """Return the name of the cleanup method to call on *instance*, memoized by type."""
+        cls = type(instance)
+        try:
+            return self._disposerCache[cls]
+        except KeyError:
+            pass
+        name = next((n for n in _DISPOSER_NAMES if callable(getattr(cls, n, None))), None)
+        self._disposerCache[cls] = name
+        return name
+
     def _resolveKey(self, interface: Union[str, Type]) -> str:
         """Resolve a string key from a string or a class/type."""
         if isinstance(interface, str):
@@ -65,6 +88,7 @@ class ServiceLocator(QObject):
             register(MyClass, instance)  → key = FQN of MyClass
             register('my_key', instance) → key = 'my_key'  (legacy)
         """
+        alias = None
         if instance is _SENTINEL:
             # Single-arg form: register(instance)
             actualInstance = interfaceOrInstance
@@ -73,7 +97,7 @@ class ServiceLocator(QObject):
             # Two-arg form: register(str|Type, instance)
             try:
                 key = self._resolveKey(type(instance))
-                self._backCompatibleMaps[interfaceOrInstance] = key
+                alias = interfaceOrInstance
             except TypeError:
                 key = self._resolveKey(interfaceOrInstance)
                 del self._backCompatibleMaps[interfaceOrInstance]
@@ -81,7 +105,62 @@ class ServiceLocator(QObject):
         with QMutexLocker(self._lock):
             if key in self._singletons:
                 logger.warning(f'Overwriting existing singleton service: {key}')
-            self._singletons[key] = actualInstance
+            # Publish a new mapping; the name rebind is atomic, so lock-free readers see old or new, never partial
+            self._singletons = {**self._singletons, key: actualInstance}
+            # Alias only after the instance is visible, so a lock-free get(alias) never resolves to a missing key
+            if alias is not None:
+                self._backCompatibleMaps[alias] = key
+
+    def registerMany(self, services: Mapping[Union[str, Type], Any]) -> None:
+        """Register several global singletons with a single lock acquisition.
+        Each entry behaves like register(key, instance): string keys become
+        aliases of the instance type FQN, class keys resolve to their FQN.
+        """
+        resolved = {}
+        aliases = {}
+        for interface, instance in services.items():
+            key = self._resolveKey(type(instance))
+            resolved[key] = instance
+            aliases[interface] = key
+        with QMutexLocker(self._lock):
+            for key in resolved.keys() & self._singletons.keys():
+                logger.warning(f'Overwriting existing singleton service: {key}')
+            # One copy-on-write publish for the whole batch, aliases only once instances are visible
+            self._singletons = {**self._singletons, **resolved}
+            self._backCompatibleMaps.update(aliases)
+
+    def registerFactory(self, interface: Union[str, Type], factory: Callable[[], Any]) -> None:
+        """Register a lazy global singleton.
+        The factory runs once, on the first get() with the same key, and its result
+        is then registered exactly like register(interface, instance).
+        A string key is also bound to the FQN of the type the factory declares
+        (a class factory, or its return annotation), so get(ThatType) builds it too.
+        Examples:
+            registerFactory('network', lambda: NetworkManager(config))
+            registerFactory('network', createNetworkManager)  # def createNetworkManager() -> NetworkManager
+            registerFactory(MyClass, MyClass)
+        """
+        key = self._resolveKey(interface)
+        provided = self._resolveFactoryType(factory) if isinstance(interface, str) else None
+        with QMutexLocker(self._lock):
+            if provided is None:
+                self._factories[key] = factory
+                return
+            typeKey = self._resolveKey(provided)
+            self._factories[typeKey] = factory
+            # Alias the string to the declared type FQN; get(name) and get(type) then share one factory
+            self._backCompatibleMaps[interface] = typeKey
+
+    @staticmethod
+    def _resolveFactoryType(factory: Callable[[], Any]) -> Optional[Type]:
+        """Return the class a factory declares it builds, or None when it declares nothing usable."""
+        if isinstance(factory, type):
+            return factory
+        try:
+            provided = get_type_hints(factory).get('return')
+        except Exception:
+            return None
+        return provided if isinstance(provided, type) else None
 
     def get(self, interface: Union[str, Type[T]], default: Optional[T] = None) -> Optional[T]:
         """Retrieve a global singleton by string key or class.
@@ -91,8 +170,29 @@ class ServiceLocator(QObject):
             get(MyClass, default) → returns default if not found
         """
         key = self._resolveKey(interface)
-        with QMutexLocker(self._lock):
-            return self._singletons.get(key, default)
+        instance = self._singletons.get(key, _SENTINEL)
+        if instance is not _SENTINEL:
+            return instance
+        if key in self._factories:
+            return self._buildFromFactory(interface, default)
+        return default
+
+    def _buildFromFactory(self, interface: Union[str, Type], default: Any) -> Any:
+        """Slow path of get(): run a pending factory once (double-checked under _factoryLock)."""
+        with QMutexLocker(self._factoryLock):
+            key = self._resolveKey(interface)
+            factory = self._factories.get(key)
+            if factory is None:
+                # Another thread built it while we waited (key now aliases to the instance FQN)
+                return self._singletons.get(key, default)
+            instance = factory()
+            self.register(interface, instance)
+            with QMutexLocker(self._lock):
+                self._factories.pop(key, None)
+                if key not in self._singletons and key not in self._backCompatibleMaps:
+                    # Factory built a subclass of its declared type; keep the declared key resolvable
+                    self._singletons = {**self._singletons, key: instance}
+            return instance
 
     # =========================================================================
     # SCOPED / TAGGED MANAGEMENT (Factory Instances)
@@ -104,17 +204,19 @@ class ServiceLocator(QObject):
         Duplicate objects in the same scope are silently ignored.
         """
         with QMutexLocker(self._lock):
-            if tag not in self._scopes:
-                self._scopes[tag] = []
+            instances, ids = self._scopes.setdefault(tag, ([], set()))
             # Avoid duplicate registration of the exact same object in the same scope
-            if instance not in self._scopes[tag]:
-                self._scopes[tag].append(instance)
+            instanceId = id(instance)
+            if instanceId not in ids:
+                instances.append(instance)
+                ids.add(instanceId)
             logger.debug(f"Registered scoped instance {instance.__class__.__name__} under tag '{tag}'")
 
     def getScoped(self, tag: str) -> List[Any]:
         """Get all instances associated with a tag."""
         with QMutexLocker(self._lock):
-            return list(self._scopes.get(tag, []))
+            bucket = self._scopes.get(tag)
+            return list(bucket[0]) if bucket else []
 
     def getScopedByType(self, tag: str, cls: Type[T]) -> Optional[T]:
         """Get the first scoped instance matching the given class under a tag.
@@ -125,9 +227,11 @@ class ServiceLocator(QObject):
             First matched instance or None.
         """
         with QMutexLocker(self._lock):
-            for instance in self._scopes.get(tag, []):
-                if isinstance(instance, cls):
-                    return instance
+            bucket = self._scopes.get(tag)
+            if bucket:
+                for instance in bucket[0]:
+                    if isinstance(instance, cls):
+                        return instance
         return None
 
     def releaseScope(self, tag: str) -> None:
@@ -140,19 +244,16 @@ class ServiceLocator(QObject):
         with QMutexLocker(self._lock):
             if tag not in self._scopes:
                 return
-            instances = self._scopes[tag]
+            instances = self._scopes[tag][0]
             logger.info(f"Releasing scope '{tag}' with {len(instances)} instances.")
             for instance in instances:
                 try:
-                    # Priority 1: standard cleanup() method (IDisposable)
-                    if hasattr(instance, 'cleanup') and callable(instance.cleanup):
-                        instance.cleanup()
-                    # Priority 2: generic close() method
-                    elif hasattr(instance, 'close') and callable(instance.close):
-                        instance.close()
-                    # Priority 3: generic dispose() method
-                    elif hasattr(instance, 'dispose') and callable(instance.dispose):
-                        instance.dispose()
+                    name = self._resolveDisposer(instance)
+                    if name is None:
+                        # Rare: disposer attached per-instance rather than on the class
+                        name = next((n for n in _DISPOSER_NAMES if callable(getattr(instance, n, None))), None)
+                    if name is not None:
+                        getattr(instance, name)()
                 except Exception as e:
                     logger.opt(exception=e).error(f"Error cleaning up instance {instance} in scope '{tag}': {e}")
             # Remove the key entirely.
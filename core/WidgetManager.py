@@ -11,10 +11,14 @@
 #                  * -  Copyright © 2026 (Z) Programing  - *
 #                  *    -  -  All Rights Reserved  -  -    *
 #                  * * * * * * * * * * * * * * * * * * * * *
-from typing import Callable, Union
+from typing import Callable, Optional, Union
 
 from PySide6.QtCore import QCoreApplication, QObject
 from PySide6.QtWidgets import QApplication, QCheckBox, QDoubleSpinBox, QLabel, QLineEdit, QRadioButton, QSpinBox, QTableView, QTableWidget, QTextEdit, QWidget
+from shiboken6 import isValid
+
+# Sentinel for attributes missing while validating a cached get() path
+_MISSING = object()
 
 
 class WidgetManager:
@@ -26,6 +30,17 @@ class WidgetManager:
         widget_class_name (str): Name of the controller/component class
     """
 
+    # Value setters per widget type; subclasses resolve through their MRO once and are memoized
+    _SETTERS = {
+        QSpinBox: lambda w, v: w.setValue(int(v)),
+        QDoubleSpinBox: lambda w, v: w.setValue(float(v)),
+        QLineEdit: lambda w, v: w.setText(str(v)),
+        QLabel: lambda w, v: w.setText(str(v)),
+        QCheckBox: lambda w, v: w.setChecked(bool(v)),
+        QRadioButton: lambda w, v: w.setChecked(bool(v)),
+    }
+    _setterCache = {}
+
     def __init__(self, controller):
         """Initialize widget manager
         Args:
@@ -35,6 +50,8 @@ class WidgetManager:
         clsName = controller.__class__.__name__
         self.type = 1 if 'Controller' in clsName else 2
         self.widgetClassName = clsName
+        # widgetName -> (keys, parents, widget), for QObject leaves reached through plain attributes only
+        self._getCache = {}
         from core.QtAppContext import QtAppContext
         self.app: Union[QApplication, QCoreApplication] = QtAppContext.globalInstance().app
 
@@ -47,6 +64,18 @@ class WidgetManager:
                 pass
         return attr
 
+    @staticmethod
+    def _setterFor(widget) -> Optional[Callable]:
+        """Return the value setter for the widget's type, or None if it is not a supported widget."""
+        cls = type(widget)
+        try:
+            return WidgetManager._setterCache[cls]
+        except KeyError:
+            pass
+        setter = next((WidgetManager._SETTERS[base] for base in cls.__mro__ if base in WidgetManager._SETTERS), None)
+        WidgetManager._setterCache[cls] = setter
+        return setter
+
     def get(self, widgetName: str) -> Union[QObject, QWidget, QTextEdit, QLabel, QLineEdit, QTableView, QTableWidget, QSpinBox]:
         """Get a widget by name
         Supports nested widget names using dot notation (e.g. 'parent.child')
@@ -57,19 +86,45 @@ class WidgetManager:
         Raises:
             Exception: If widget not found
         """
+        cached = self._getCache.get(widgetName)
+        if cached is not None and self._isCacheCurrent(*cached):
+            return self._attrOrCall(cached[2])
         keys = widgetName.split('.')
         resolved = []
+        parents = []
         currentParent = self.controller
+        cacheable = True
         for key in keys:
             if not hasattr(currentParent, key):
                 raise Exception(f'Widget {key} not found in {self.controller}.\nWas resolved: {".".join(resolved)}')
             attr = getattr(currentParent, key)
+            parents.append(currentParent)
             if key != keys[-1]:
                 resolved.append(key)
+                # Intermediate call results may change between calls; don't cache through them
+                cacheable = cacheable and not callable(attr)
                 currentParent = self._attrOrCall(attr)
                 continue
+            # Only widgets are cached: plain values must always reflect the current attribute
+            if cacheable and isinstance(attr, QObject):
+                self._getCache[widgetName] = (keys, parents, attr)
             return self._attrOrCall(attr)
 
+    @staticmethod
+    def _isCacheCurrent(keys, parents, leaf) -> bool:
+        """True while every attribute on the cached path still holds the same object and the widget is alive."""
+        if not isValid(leaf):
+            # C++ side deleted (e.g. a rebuilt UI)
+            return False
+        nextObjs = parents[1:] + [leaf]
+        return all(getattr(parent, key, _MISSING) is nextObj for parent, key, nextObj in zip(parents, keys, nextObjs))
+
+    def _invalidateGetCache(self, name: str) -> None:
+        """Forget cached get() paths equal to or nested under name."""
+        prefix = name + '.'
+        for cachedName in [k for k in self._getCache if k == name or k.startswith(prefix)]:
+            del self._getCache[cachedName]
+
     def set(self, name: str, value, saveToConfig: bool = False) -> None:
         """Set a widget attribute value
         Args:
@@ -81,14 +136,12 @@ class WidgetManager:
         """
         if '.' in name:
             raise NotImplementedError('Dot notation not allowed in widget names for set()')
+        self._invalidateGetCache(name)
         if hasattr(self.controller, name):
             widget = getattr(self.controller, name)
-            if isinstance(widget, (QSpinBox, QDoubleSpinBox)):
-                widget.setValue(float(value) if isinstance(widget, QDoubleSpinBox) else int(value))
-            elif isinstance(widget, (QLineEdit, QLabel)):
-                widget.setText(str(value))
-            elif isinstance(widget, (QCheckBox, QRadioButton)):
-                widget.setChecked(bool(value))
+            setter = self._setterFor(widget)
+            if setter is not None:
+                setter(widget, value)
             else:
                 setattr(self.controller, name, value)
         else:
@@ -112,12 +165,9 @@ class WidgetManager:
         value = config.get(configKey, default)
         if value is not None and hasattr(self.controller, name):
             widget = getattr(self.controller, name)
-            if isinstance(widget, (QSpinBox, QDoubleSpinBox)):
-                widget.setValue(float(value) if isinstance(widget, QDoubleSpinBox) else int(value))
-            elif isinstance(widget, (QLineEdit, QLabel)):
-                widget.setText(str(value))
-            elif isinstance(widget, (QCheckBox, QRadioButton)):
-                widget.setChecked(bool(value))
+            setter = self._setterFor(widget)
+            if setter is not None:
+                setter(widget, value)
 
     def doActionSuppressSignal(self, widgetName: str, closure: Callable) -> None:
         """Execute action on widget with signals temporarily blocked
@@ -24,15 +24,22 @@ Subclasses must implement:
 #                  * -  Copyright © 2026 (Z) Programing  - *
 #                  *    -  -  All Rights Reserved  -  -    *
 #                  * * * * * * * * * * * * * * * * * * * * *
-import time
-import uuid
+import itertools
+import os
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from core.Logging import logger
 
 from .AcknowledgmentTracker import AcknowledgmentTracker
 
+# Ack ids are <process prefix><thread lane><per-thread counter>: unique without shared mutable state
+_ACK_ID_PREFIX = os.urandom(4).hex()
+# Hands each thread its lane once; next() on itertools.count is atomic under the GIL
+_ackIdLanes = itertools.count()
+_ackIdLocal = threading.local()
+
 
 class AcknowledgmentReceiver(ABC):
     """
@@ -59,7 +66,13 @@ class AcknowledgmentReceiver(ABC):
         Returns:
             Unique ack_id string
         """
-        return f'ack_{uuid.uuid4().hex[:12]}'
+        try:
+            lane = _ackIdLocal.lane
+        except AttributeError:
+            lane = _ackIdLocal.lane = next(_ackIdLanes)
+            _ackIdLocal.counter = 0
+        _ackIdLocal.counter += 1
+        return f'ack_{_ACK_ID_PREFIX}{lane:06x}{_ackIdLocal.counter:08x}'
 
     def emitEventWithAck(self, eventName: str, timeout: float = 30.0, **eventData) -> str:
         """
@@ -74,7 +87,7 @@ class AcknowledgmentReceiver(ABC):
         """
         ackId = self.generateAckId()
         self._ack_tracker.registerPending(ackId, successCallback=self._on_ack_received, errorCallback=self._on_ack_error, timeoutCallback=self._on_ack_timeout, timeout=timeout)
-        logger.debug(f'Emitting event {eventName} with ack_id={ackId}')
+        logger.debug('Emitting event {} with ack_id={}', eventName, ackId)
         try:
             self._do_emit_event(eventName, ackId, **eventData)
         except Exception as e:
@@ -83,6 +96,31 @@ class AcknowledgmentReceiver(ABC):
             raise
         return ackId
 
+    def emitEventsWithAck(self, events: Iterable[Tuple[str, Dict[str, Any]]], timeout: float = 30.0) -> List[str]:
+        """
+        Emit a burst of events, registering all their acknowledgments in one batch.
+        Args:
+            events: (event_name, event_data) pairs
+            timeout: Timeout in seconds, applied to every event
+        Returns:
+            ack_ids in the same order as events
+        Note: If an emit fails, that event and every event not yet emitted are
+              acknowledged as errors before the exception is re-raised.
+        """
+        events = list(events)
+        ackIds = [self.generateAckId() for _ in events]
+        self._ack_tracker.registerPendingBatch([(ackId, self._on_ack_received, self._on_ack_error, self._on_ack_timeout, timeout) for ackId in ackIds])
+        logger.debug('Emitting {} events with acks', len(events))
+        for index, ((eventName, eventData), ackId) in enumerate(zip(events, ackIds)):
+            try:
+                self._do_emit_event(eventName, ackId, **eventData)
+            except Exception as e:
+                logger.error(f'Failed to emit event {eventName}: {e}')
+                for unsentId in ackIds[index:]:
+                    self._ack_tracker.acknowledgeError(unsentId, e)
+                raise
+        return ackIds
+
     @abstractmethod
     def _do_emit_event(self, eventName: str, ackId: str, **kwargs) -> None:
         """
@@ -106,16 +144,13 @@ class AcknowledgmentReceiver(ABC):
             timeout: Maximum time to wait in seconds
         Returns:
             True if all acks received, False if timeout
-        Note: Uses polling with 100ms interval
-        """
-        startTime = time.time()
-        logger.debug(f'Waiting for {self._ack_tracker.pendingCount()} acknowledgments (timeout={timeout}s)')
-        while self._ack_tracker.pendingCount() > 0:
-            if time.time() - startTime > timeout:
-                pending = self._ack_tracker.getAllPendingIds()
-                logger.warning(f'Timeout waiting for acknowledgments: {pending}')
-                return False
-            time.sleep(0.1)
+        Note: Wakes as soon as the tracker becomes idle (no polling)
+        """
+        logger.debug('Waiting for {} acknowledgments (timeout={}s)', self._ack_tracker.pendingCount(), timeout)
+        if not self._ack_tracker.waitIdle(timeout):
+            pending = self._ack_tracker.getAllPendingIds()
+            logger.warning(f'Timeout waiting for acknowledgments: {pending}')
+            return False
         logger.debug('All acknowledgments received')
         return True
 
@@ -147,7 +182,7 @@ class AcknowledgmentReceiver(ABC):
             result: Result data from sender
         """
         self._ack_results[ackId] = result
-        logger.debug(f'Ack received: {ackId}')
+        logger.debug('Ack received: {}', ackId)
 
     def _on_ack_error(self, ackId: str, error: Exception) -> None:
         """
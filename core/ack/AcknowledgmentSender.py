@@ -63,7 +63,7 @@ class AcknowledgmentSender(ABC):
         try:
             self._ack_tracker.acknowledge(ackId, result)
             self._on_ack_sent(ackId, result)
-            logger.debug(f'Sent ack: {ackId}')
+            logger.debug('Sent ack: {}', ackId)
         except Exception as e:
             logger.error(f'Error sending ack {ackId}: {e}', excInfo=True)
 
@@ -78,7 +78,7 @@ class AcknowledgmentSender(ABC):
         try:
             self._ack_tracker.acknowledgeError(ackId, error)
             self._on_error_ack_sent(ackId, error)
-            logger.debug(f'Sent error ack: {ackId}')
+            logger.debug('Sent error ack: {}', ackId)
         except Exception as e:
             logger.error(f'Error sending error ack {ackId}: {e}', excInfo=True)
 
@@ -4,8 +4,14 @@ AcknowledgmentTracker - Core coordinator for ACK/NACK protocol.
 This class manages pending acknowledgments and coordinates callbacks between
 sender and receiver components.
 
-Thread-Safety: Uses QMutex for all critical sections.
-Timeout: Uses threading.Timer for each pending acknowledgment.
+Thread-Safety: Pending acks are striped across _SHARD_COUNT dicts, each with its own threading.Lock
+               (not tied to Qt, so no PySide6 binding round-trip per lock/unlock).
+               acknowledge()/acknowledgeError() skip the mutex: an atomic dict.pop decides
+               which of them (or the timeout) wins an ack.
+Timeout: One scheduler thread per tracker pops a heap of (deadline, ack_id) entries;
+         it only runs while timeouts are outstanding.
+Idle wait: A threading.Event is set whenever no acknowledgment is pending.
+Logging: Per-ack debug lines pass brace-style args, so loguru only formats them when DEBUG is on.
 """
 
 #                  M""""""""`M            dP
@@ -21,27 +27,31 @@ Timeout: Uses threading.Timer for each pending acknowledgment.
 #                  * -  Copyright © 2026 (Z) Programing  - *
 #                  *    -  -  All Rights Reserved  -  -    *
 #                  * * * * * * * * * * * * * * * * * * * * *
+import heapq
 import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional
-
-from PySide6.QtCore import QMutex, QMutexLocker
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from core.Logging import logger
 
+# Number of independently locked pending-ack stripes; must be a power of two
+_SHARD_COUNT = 16
+
 
-@dataclass
+@dataclass(slots=True)
 class PendingAck:
-    """Data structure for a pending acknowledgment."""
+    """Data structure for a pending acknowledgment (slotted: no per-instance __dict__)."""
 
     ackId: str
     successCallback: Callable[[str, Any], None]
     errorCallback: Optional[Callable[[str, Exception], None]]
     timeoutCallback: Optional[Callable[[str], None]]
     timeout: float
+    # time.monotonic() timestamps, immune to wall-clock jumps
     registeredAt: float
-    timer: Optional[threading.Timer] = None
+    # Expiry (registeredAt + timeout); 0.0 when the ack never times out
+    deadline: float = 0.0
 
 
 class AcknowledgmentTracker:
@@ -57,8 +67,63 @@ class AcknowledgmentTracker:
     """
 
     def __init__(self):
-        self._pending: Dict[str, PendingAck] = {}
-        self._lock = QMutex()
+        # Striped pending map: an ack only ever locks the shard its id hashes to.
+        # Each shard is (records, expiries, mutex): expiries mirrors records' keys with just
+        # registeredAt + timeout, so expiry sweeps scan floats instead of full records.
+        self._shards: List[Tuple[Dict[str, PendingAck], Dict[str, float], threading.Lock]] = [({}, {}, threading.Lock()) for _ in range(_SHARD_COUNT)]
+        # Pending acks plus callbacks still running; increments happen under the owning shard lock
+        self._count = 0
+        self._countLock = threading.Lock()
+        # Set while nothing is pending; waitIdle() blocks on it instead of polling
+        self._idleEvent = threading.Event()
+        self._idleEvent.set()
+        # Timeout scheduler: min-heap of (deadline, ackId), guarded by its own condition.
+        # Entries are never removed on ack; the worker skips ids that are no longer pending.
+        self._deadlines: List[Tuple[float, str]] = []
+        self._timeoutCond = threading.Condition()
+        self._timeoutThread: Optional[threading.Thread] = None
+
+    def _shard(self, ackId: str) -> Tuple[Dict[str, PendingAck], Dict[str, float], threading.Lock]:
+        """Return the (records, expiries, mutex) stripe owning ackId."""
+        return self._shards[hash(ackId) & (_SHARD_COUNT - 1)]
+
+    def _adjustCount(self, delta: int) -> None:
+        """Update the pending total and the idle event together."""
+        with self._countLock:
+            self._count += delta
+            if self._count:
+                self._idleEvent.clear()
+            else:
+                self._idleEvent.set()
+
+    def _popPending(self, ackId: str, deadline: Optional[float] = None) -> Optional[PendingAck]:
+        """
+        Remove and return the pending ack for ackId, or None if it is not pending.
+        When deadline is given, only a registration with that exact deadline is removed.
+        The pending total is left as is: callers release it with _adjustCount(-1) once the
+        callback has returned, so waitIdle() never wakes ahead of a running callback.
+        """
+        pending, expiries, lock = self._shard(ackId)
+        with lock:
+            pendingAck = pending.get(ackId)
+            if pendingAck is None or (deadline is not None and pendingAck.deadline != deadline):
+                return None
+            # A lock-free acknowledge may have won since the get(); pop tells us
+            if pending.pop(ackId, None) is None:
+                return None
+            expiries.pop(ackId, None)
+        return pendingAck
+
+    def _takePending(self, ackId: str) -> Optional[PendingAck]:
+        """
+        Lock-free variant of _popPending() for the acknowledge paths.
+        dict.pop is atomic, so exactly one of acknowledge/acknowledgeError/timeout gets the record.
+        """
+        pending, expiries, _ = self._shard(ackId)
+        pendingAck = pending.pop(ackId, None)
+        if pendingAck is not None:
+            expiries.pop(ackId, None)
+        return pendingAck
 
     def registerPending(
         self,
@@ -79,19 +144,77 @@ class AcknowledgmentTracker:
         Raises:
             ValueError: If ack_id already pending
         """
-        locker = QMutexLocker(self._lock)
-        if ackId in self._pending:
-            raise ValueError(f'Acknowledgment {ackId} already pending')
+        now = time.monotonic()
         pendingAck = PendingAck(
-            ackId=ackId, successCallback=successCallback, errorCallback=errorCallback, timeoutCallback=timeoutCallback, timeout=timeout, registeredAt=time.time()
+            ackId=ackId, successCallback=successCallback, errorCallback=errorCallback, timeoutCallback=timeoutCallback, timeout=timeout, registeredAt=now
         )
         if timeout > 0:
-            timer = threading.Timer(timeout, self._handle_timeout, args=[ackId])
-            timer.daemon = True
-            pendingAck.timer = timer
-            timer.start()
-        self._pending[ackId] = pendingAck
-        logger.debug(f'Registered pending ack: {ackId} (timeout: {timeout}s)')
+            pendingAck.deadline = now + timeout
+        pending, expiries, lock = self._shard(ackId)
+        with lock:
+            if ackId in pending:
+                raise ValueError(f'Acknowledgment {ackId} already pending')
+            # Count first: a lock-free acknowledge may pop the record as soon as it is visible
+            self._adjustCount(1)
+            pending[ackId] = pendingAck
+            expiries[ackId] = now + timeout
+            if timeout > 0:
+                self._scheduleTimeouts(((pendingAck.deadline, ackId),))
+        logger.debug('Registered pending ack: {} (timeout: {}s)', ackId, timeout)
+
+    def registerPendingBatch(
+        self,
+        entries: Iterable[Tuple[str, Callable[[str, Any], None], Optional[Callable[[str, Exception], None]], Optional[Callable[[str], None]], float]],
+    ) -> None:
+        """
+        Register several pending acknowledgments at once.
+        Each touched shard is locked once and all deadlines are pushed to the scheduler
+        in a single pass. The batch is all-or-nothing: nothing is registered on error.
+        Args:
+            entries: (ack_id, success_callback, error_callback, timeout_callback, timeout) tuples
+        Raises:
+            ValueError: If an ack_id is already pending or repeated in the batch
+        """
+        now = time.monotonic()
+        byShard: Dict[int, List[PendingAck]] = {}
+        seen = set()
+        for ackId, successCallback, errorCallback, timeoutCallback, timeout in entries:
+            if ackId in seen:
+                raise ValueError(f'Acknowledgment {ackId} repeated in batch')
+            seen.add(ackId)
+            pendingAck = PendingAck(
+                ackId=ackId, successCallback=successCallback, errorCallback=errorCallback, timeoutCallback=timeoutCallback, timeout=timeout, registeredAt=now
+            )
+            if timeout > 0:
+                pendingAck.deadline = now + timeout
+            byShard.setdefault(hash(ackId) & (_SHARD_COUNT - 1), []).append(pendingAck)
+        if not byShard:
+            return
+        # Ascending shard order; single-ack paths never hold two shard locks, so this cannot deadlock
+        locks = [self._shards[index][2] for index in sorted(byShard)]
+        for lock in locks:
+            lock.acquire()
+        try:
+            for index, pendingAcks in byShard.items():
+                pending = self._shards[index][0]
+                for pendingAck in pendingAcks:
+                    if pendingAck.ackId in pending:
+                        raise ValueError(f'Acknowledgment {pendingAck.ackId} already pending')
+            self._adjustCount(len(seen))
+            deadlines = []
+            for index, pendingAcks in byShard.items():
+                pending, expiries, _ = self._shards[index]
+                for pendingAck in pendingAcks:
+                    pending[pendingAck.ackId] = pendingAck
+                    expiries[pendingAck.ackId] = now + pendingAck.timeout
+                    if pendingAck.deadline:
+                        deadlines.append((pendingAck.deadline, pendingAck.ackId))
+            if deadlines:
+                self._scheduleTimeouts(deadlines)
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+        logger.debug('Registered {} pending acks in batch', len(seen))
 
     def acknowledge(self, ackId: str, result: Any = None) -> None:
         """
@@ -101,20 +224,18 @@ class AcknowledgmentTracker:
             result: Result data from sender
         Note: Does nothing if ack_id not found (may have already timed out)
         """
-        locker = QMutexLocker(self._lock)
-        if ackId not in self._pending:
+        pendingAck = self._takePending(ackId)
+        if pendingAck is None:
             logger.warning(f'Ack {ackId} not pending (may have timed out)')
             return
-        pendingAck = self._pending.pop(ackId)
-        if pendingAck.timer:
-            pendingAck.timer.cancel()
-        locker.unlock()
         try:
-            elapsed = time.time() - pendingAck.registeredAt
-            logger.debug(f'Ack received: {ackId} ({elapsed:.2f}s)')
+            elapsed = time.monotonic() - pendingAck.registeredAt
+            logger.debug('Ack received: {} ({:.2f}s)', ackId, elapsed)
             pendingAck.successCallback(ackId, result)
         except Exception as e:
             logger.error(f'Error in success callback for {ackId}: {e}', exc_info=True)
+        finally:
+            self._adjustCount(-1)
 
     def acknowledgeError(self, ackId: str, error: Exception) -> None:
         """
@@ -124,23 +245,21 @@ class AcknowledgmentTracker:
             error: Error from sender
         Note: Does nothing if ack_id not found (may have already timed out)
         """
-        locker = QMutexLocker(self._lock)
-        if ackId not in self._pending:
+        pendingAck = self._takePending(ackId)
+        if pendingAck is None:
             logger.warning(f'Ack {ackId} not pending (may have timed out)')
             return
-        pendingAck = self._pending.pop(ackId)
-        if pendingAck.timer:
-            pendingAck.timer.cancel()
-        locker.unlock()
         try:
-            elapsed = time.time() - pendingAck.registeredAt
-            logger.debug(f'Ack error received: {ackId} ({elapsed:.2f}s)')
+            elapsed = time.monotonic() - pendingAck.registeredAt
+            logger.debug('Ack error received: {} ({:.2f}s)', ackId, elapsed)
             if pendingAck.errorCallback:
                 pendingAck.errorCallback(ackId, error)
             else:
                 logger.error(f'Ack error for {ackId}: {error}')
         except Exception as e:
             logger.opt(exception=e).error(f'Error in error callback for {ackId}: {e}', exc_info=True)
+        finally:
+            self._adjustCount(-1)
 
     def isPending(self, ackId: str) -> bool:
         """
@@ -150,61 +269,119 @@ class AcknowledgmentTracker:
         Returns:
             True if pending, False otherwise
         """
-        locker = QMutexLocker(self._lock)
-        return ackId in self._pending
+        pending, _, lock = self._shard(ackId)
+        with lock:
+            return ackId in pending
 
     def pendingCount(self) -> int:
         """
         Get number of pending acknowledgments.
         Returns:
-            Number of pending acks
+            Number of pending acks, including ones whose callback is still running
         """
-        locker = QMutexLocker(self._lock)
-        return len(self._pending)
+        return self._count
+
+    def waitIdle(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until no acknowledgment is pending and every callback has returned.
+        Args:
+            timeout: Maximum time to wait in seconds (None waits forever)
+        Returns:
+            True if idle, False if timeout
+        """
+        return self._idleEvent.wait(timeout)
 
     def cleanupExpired(self) -> None:
         """
         Manually cleanup expired acknowledgments.
-        Note: Normally not needed as Timer handles this automatically.
+        Note: Normally not needed as the timeout scheduler handles this automatically.
         Provided for testing and edge cases.
         """
-        locker = QMutexLocker(self._lock)
-        now = time.time()
-        expired = []
-        for ackId, pendingAck in self._pending.items():
-            if now - pendingAck.registeredAt >= pendingAck.timeout:
-                expired.append(ackId)
-        for ackId in expired:
-            pendingAck = self._pending.pop(ackId)
-            if pendingAck.timer:
-                pendingAck.timer.cancel()
-            locker.unlock()
-            try:
-                logger.warning(f'Ack timeout (manual cleanup): {ackId}')
-                if pendingAck.timeoutCallback:
-                    pendingAck.timeoutCallback(ackId)
-            except Exception as e:
-                logger.error(f'Error in timeout callback for {ackId}: {e}', exc_info=True)
-            locker.relock()
-
-    def _handle_timeout(self, ackId: str) -> None:
-        """
-        Internal timeout handler (called by Timer).
+        now = time.monotonic()
+        for pending, expiries, lock in self._shards:
+            # Lock only across the dict mutation; callbacks below run unlocked
+            with lock:
+                # Scan the dense expiry floats; full records are only touched for ids that fire.
+                # list() snapshots atomically, as lock-free acknowledges may pop concurrently.
+                expiredIds = [ackId for ackId, expiresAt in list(expiries.items()) if now >= expiresAt]
+                expired = []
+                for ackId in expiredIds:
+                    expiries.pop(ackId, None)
+                    pendingAck = pending.pop(ackId, None)
+                    if pendingAck is not None:
+                        expired.append(pendingAck)
+            for pendingAck in expired:
+                try:
+                    logger.warning(f'Ack timeout (manual cleanup): {pendingAck.ackId}')
+                    if pendingAck.timeoutCallback:
+                        pendingAck.timeoutCallback(pendingAck.ackId)
+                except Exception as e:
+                    logger.error(f'Error in timeout callback for {pendingAck.ackId}: {e}', exc_info=True)
+                finally:
+                    self._adjustCount(-1)
+
+    def _scheduleTimeouts(self, deadlines: Iterable[Tuple[float, str]]) -> None:
+        """
+        Push (deadline, ack_id) entries onto the scheduler heap, starting the worker if it is idle.
+        Called with the owning shard locks held, after the acks are in their shards.
+        """
+        with self._timeoutCond:
+            for entry in deadlines:
+                heapq.heappush(self._deadlines, entry)
+            # Acked ids leave stale entries behind; rebuild once they outnumber the live ones
+            if len(self._deadlines) > 64 and len(self._deadlines) > 2 * self._count:
+                self._deadlines = [entry for entry in self._deadlines if self._isScheduled(*entry)]
+                heapq.heapify(self._deadlines)
+            if self._timeoutThread is None:
+                self._timeoutThread = threading.Thread(target=self._timeoutWorker, name='AckTimeoutScheduler', daemon=True)
+                self._timeoutThread.start()
+            else:
+                self._timeoutCond.notify()
+
+    def _isScheduled(self, deadline: float, ackId: str) -> bool:
+        """Whether a heap entry still belongs to a live registration (lock-free dict read)."""
+        pendingAck = self._shard(ackId)[0].get(ackId)
+        return pendingAck is not None and pendingAck.deadline == deadline
+
+    def _timeoutWorker(self) -> None:
+        """
+        Scheduler loop: sleep until the earliest deadline, then fire it.
+        Exits once the heap is empty; _scheduleTimeouts() restarts it on demand.
+        """
+        while True:
+            with self._timeoutCond:
+                while True:
+                    if not self._deadlines:
+                        self._timeoutThread = None
+                        return
+                    deadline, ackId = self._deadlines[0]
+                    delay = deadline - time.monotonic()
+                    if delay <= 0:
+                        heapq.heappop(self._deadlines)
+                        break
+                    self._timeoutCond.wait(delay)
+            self._handle_timeout(ackId, deadline)
+
+    def _handle_timeout(self, ackId: str, deadline: Optional[float] = None) -> None:
+        """
+        Internal timeout handler (called by the scheduler).
         Args:
             ack_id: Acknowledgment ID that timed out
+            deadline: Deadline of the heap entry; entries left over from an earlier
+                      registration of the same ack_id are ignored
         """
-        locker = QMutexLocker(self._lock)
-        if ackId not in self._pending:
+        pendingAck = self._popPending(ackId, deadline)
+        if pendingAck is None:
             return
-        pendingAck = self._pending.pop(ackId)
-        locker.unlock()
         try:
-            elapsed = time.time() - pendingAck.registeredAt
+            elapsed = time.monotonic() - pendingAck.registeredAt
             logger.warning(f'Ack timeout: {ackId} ({elapsed:.2f}s)')
             if pendingAck.timeoutCallback:
                 pendingAck.timeoutCallback(ackId)
         except Exception as e:
             logger.error(f'Error in timeout callback for {ackId}: {e}', exc_info=True)
+        finally:
+            self._adjustCount(-1)
 
     def getAllPendingIds(self) -> list[str]:
         """
@@ -213,18 +390,31 @@ class AcknowledgmentTracker:
             List of pending ack_ids
         Note: For debugging/testing purposes
         """
-        locker = QMutexLocker(self._lock)
-        return list(self._pending.keys())
+        ackIds = []
+        for pending, _, lock in self._shards:
+            with lock:
+                ackIds.extend(pending)
+        return ackIds
 
     def clearAll(self) -> None:
         """
-        Clear all pending acknowledgments and cancel timers.
+        Clear all pending acknowledgments and their scheduled timeouts.
         Warning: This does NOT call callbacks. Use for cleanup/shutdown only.
         """
-        locker = QMutexLocker(self._lock)
-        for pendingAck in self._pending.values():
-            if pendingAck.timer:
-                pendingAck.timer.cancel()
-        count = len(self._pending)
-        self._pending.clear()
+        count = 0
+        for pending, expiries, lock in self._shards:
+            with lock:
+                # Pop rather than clear(): a concurrent lock-free acknowledge owns what it popped
+                cleared = 0
+                for ackId in list(pending):
+                    if pending.pop(ackId, None) is not None:
+                        cleared += 1
+                expiries.clear()
+                if cleared:
+                    self._adjustCount(-cleared)
+                    count += cleared
+        with self._timeoutCond:
+            # Empty heap lets the scheduler thread exit
+            self._deadlines.clear()
+            self._timeoutCond.notify()
         logger.info(f'Cleared {count} pending acknowledgments')
@@ -11,8 +11,9 @@
 #                  * -  Copyright © 2026 (Z) Programing  - *
 #                  *    -  -  All Rights Reserved  -  -    *
 #                  * * * * * * * * * * * * * * * * * * * * *
+import sys
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, FrozenSet, List
 
 if TYPE_CHECKING:
     from core.QtAppContext import QtAppContext
@@ -51,6 +52,15 @@ class ServiceProvider(ABC):
     after: List[str] = []
     requires: List[str] = []
     wants: List[str] = []
+    # Pre-built at class creation so bootstrap does not rebuild them per provider
+    _allDeps: FrozenSet[str] = frozenset()
+    _requiredDeps: FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Interned so dict/set probes against provider names hit the identity fast path
+        cls._requiredDeps = frozenset(map(sys.intern, cls.requires))
+        cls._allDeps = frozenset(map(sys.intern, (*cls.after, *cls.requires, *cls.wants)))
 
     def __init__(self, ctx: 'QtAppContext'):
         self.ctx = ctx
@@ -21,9 +21,9 @@ Provides common functionality, lifecycle management, and Qt signals integration.
 
 #
 import abc
+import secrets
 import sys
 import threading
-import uuid
 from datetime import datetime
 from typing import Self, TYPE_CHECKING, Any, Dict, Optional
 
@@ -39,6 +39,8 @@ from .UniqueType import UniqueType
 if TYPE_CHECKING:
     from .ChainContext import ChainContext
 logger = logger.bind(component='TaskSystem')
+# Guards first-time creation of a task's TaskSignals (slow path only)
+_signalsInitLock = threading.Lock()
 
 
 class QRunnableABCMeta(type(QtCore.QRunnable), abc.ABCMeta):
@@ -104,10 +106,12 @@ class AbstractTask(QtCore.QRunnable, abc.ABC, metaclass=QRunnableABCMeta):
             uniqueType: Uniqueness constraint for the task
         """
         QtCore.QRunnable.__init__(self)
-        # Standalone QObject for signal emission (decoupled from QRunnable C++ lifecycle)
-        self.signals = TaskSignals()
+        # Standalone QObject for signal emission (decoupled from QRunnable C++ lifecycle).
+        # Created on first use: tasks that are built but never tracked/run skip the QObject.
+        self._signals: Optional[TaskSignals] = None
         self.genUid()
-        self.name = name
+        # Names repeat across task instances (e.g. 'Sleep Task'); share one string object
+        self.name = sys.intern(name) if type(name) is str else name
         self.description = description
         self.chainUuid = chainUuid
         if not hasattr(self, '_chainContext'):
@@ -149,11 +153,29 @@ class AbstractTask(QtCore.QRunnable, abc.ABC, metaclass=QRunnableABCMeta):
     serializables: Optional[Any] = None
 
     def genUid(self):
-        if not hasattr(self, 'uuid') or not self.uuid:
-            self.uuid = uuid.uuid4().hex
+        if not getattr(self, 'uuid', None):
+            # 32 hex chars like uuid4().hex, without building a UUID object
+            self.uuid = secrets.token_hex(16)
 
     # ── Signal proxy properties (backward-compat) ─────────────────────────────
 
+    @property
+    def signals(self) -> TaskSignals:
+        """Per-task TaskSignals, created on first access and owned by the application thread."""
+        signals = self._signals
+        if signals is None:
+            with _signalsInitLock:
+                signals = self._signals
+                if signals is None:
+                    signals = TaskSignals()
+                    app = QtCore.QCoreApplication.instance()
+                    if app is not None and signals.thread() != app.thread():
+                        # First touched on a pool worker (e.g. inside run()); that thread has no
+                        # event loop and dies soon, so hand the QObject to the GUI thread
+                        signals.moveToThread(app.thread())
+                    self._signals = signals
+        return signals
+
     @property
     def statusChanged(self):
         """Proxy to ``self.signals.statusChanged``."""
@@ -200,14 +222,18 @@ class AbstractTask(QtCore.QRunnable, abc.ABC, metaclass=QRunnableABCMeta):
     def setProgress(self, value: int, label: str = '') -> None:
         """
         Update task progress and emit progressUpdated signal.
+        Unchanged (value, label) pairs are not re-emitted, so tight loops may call this freely.
         Args:
             value: Progress percentage (0-100)
             label: Optional label describing the current progress step
         """
-        self.progress = max(0, min(100, value))
+        value = max(0, min(100, value))
+        if value == self.progress and label == self.progressLabel:
+            return
+        self.progress = value
         self.progressLabel = label
-        logger.debug(f'Task {self.uuid} progress: {self.progress}%')
-        self.progressUpdated.emit(self.uuid, self.progress, label)
+        logger.debug('Task {} progress: {}%', self.uuid, value)
+        self.progressUpdated.emit(self.uuid, value, label)
 
     def addTag(self, tag: str) -> None:
         """Add a tag to the task."""
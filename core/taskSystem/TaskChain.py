@@ -74,7 +74,7 @@ class TaskChain(AbstractTask, Subscriber):
             task.chainUuid = self.uuid
             task.addTag('_ChainedChild')
             task.addTag(f'Parent_{self.uuid}')
-        if not hasattr(self, '_chainContext') or not isinstance(self._chainContext, ChainContext):
+        if not isinstance(getattr(self, '_chainContext', None), ChainContext):
             self._chainContext = ChainContext(self.uuid)
         self._tasks = tasks
         self._currentTaskIndex = 0
@@ -135,15 +135,17 @@ class TaskChain(AbstractTask, Subscriber):
         if not self._tasks:
             self._updateDefaultProgress()
             return
-        while self._currentTaskIndex < len(self._tasks):
+        tasks = self._tasks
+        taskCount = len(tasks)
+        while self._currentTaskIndex < taskCount:
             if self.isStopped():
                 self.setStatus(TaskStatus.CANCELLED)
                 logger.info(f'TaskChain {self.uuid} was cancelled')
                 return
             self._progress_updated_externally = False
-            task = self._tasks[self._currentTaskIndex]
+            task = tasks[self._currentTaskIndex]
             task.setChainContext(self._chainContext)
-            logger.info(f'TaskChain {self.uuid} executing task {self._currentTaskIndex + 1}/{len(self._tasks)}: {task.name}')
+            logger.info('TaskChain {} executing task {}/{}: {}', self.uuid, self._currentTaskIndex + 1, taskCount, task.name)
             isTaskSuccess = self._executeSubTaskWithRetry(task)
             if self.isStopped() or task.status == TaskStatus.CANCELLED:
                 if self.status != TaskStatus.FAILED:
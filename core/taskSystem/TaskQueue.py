@@ -24,7 +24,7 @@ Submits tasks to QThreadPool for execution.
 #                  * * * * * * * * * * * * * * * * * * * * *
 import threading as _threading
 from collections import deque
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 from PySide6 import QtCore
 
@@ -97,14 +97,17 @@ class TaskQueue(QtCore.QObject):
     # Signals are provided by TaskQueueSignals (composition).
     # Proxy properties below for backward-compat.
 
-    def __init__(self, taskTracker: TaskTracker, storage: BaseStorage, config: Config, maxConcurrentTasks: int = 3):
+    def __init__(self, taskTracker: TaskTracker, storage: BaseStorage, config: Config, maxConcurrentTasks: Union[int, str] = 3):
         """Initialize TaskQueue.
         Args:
             taskTracker: TaskTracker instance for monitoring
             storage: Storage backend for persistence
             config: Configuration instance
-            maxConcurrentTasks: Maximum number of concurrent tasks (default: 3)
+            maxConcurrentTasks: Maximum number of concurrent tasks (default: 3),
+                or 'auto' to follow QThread.idealThreadCount()
         """
+        if maxConcurrentTasks == 'auto':
+            maxConcurrentTasks = QtCore.QThread.idealThreadCount()
         super().__init__()
         self.signals = TaskQueueSignals()
         self._taskTracker = taskTracker
@@ -162,13 +165,16 @@ class TaskQueue(QtCore.QObject):
         """
         self._enqueueCommand(_CMD_ADD, task=task)
 
-    def setMaxConcurrentTasks(self, count: int) -> None:
+    def setMaxConcurrentTasks(self, count: Union[int, str]) -> None:
         """Set maximum number of concurrent tasks.
         Args:
-            count: Maximum concurrent tasks (must be > 0)
+            count: Maximum concurrent tasks (must be > 0), or 'auto' for QThread.idealThreadCount()
         """
         if count is None:
             return
+        if count == 'auto':
+            # Match the host's logical core count instead of a fixed limit
+            count = QtCore.QThread.idealThreadCount()
         if count <= 0:
             logger.warning(f'Invalid max concurrent tasks: {count}. Must be > 0')
             return
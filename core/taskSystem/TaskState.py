@@ -47,6 +47,9 @@ class TaskState:
                     # ... do work ...
     """
 
+    # One TaskState per task: fixed layout, no per-instance __dict__
+    __slots__ = ('_current', '_stopped', '_paused', '_mutex', '_pauseCondition', '_pauseCheckIntervalMs')
+
     _TERMINAL = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED})
 
     def __init__(self, initial: TaskStatus = TaskStatus.PENDING):
@@ -270,8 +270,10 @@ class TaskTracker(QtCore.QObject):
 
     def _addToHistory(self, history_list: list, item: dict, limit: int = 1000):
         history_list.append(item)
-        if len(history_list) > limit:
-            history_list[:] = history_list[-limit:]
+        overflow = len(history_list) - limit
+        if overflow > 0:
+            # Trim in place: no slice copy + reassignment of the whole history per append
+            del history_list[:overflow]
 
     def _isTaskChain(self, task: Any) -> bool:
         return task.__class__.__name__ == 'TaskChain'
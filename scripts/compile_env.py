@@ -0,0 +1,51 @@
+#                  M""""""""`M            dP
+#                  Mmmmmm   .M            88
+#                  MMMMP  .MMM  dP    dP  88  .dP   .d8888b.
+#                  MMP  .MMMMM  88    88  88888"    88'  `88
+#                  M' .MMMMMMM  88.  .88  88  `8b.  88.  .88
+#                  M         M  `88888P'  dP   `YP  `88888P'
+#                  MMMMMMMMMMM    -*-  Created by Zuko  -*-
+#
+#                  * * * * * * * * * * * * * * * * * * * * *
+#                  * -    - -   F.R.E.E.M.I.N.D   - -    - *
+#                  * -  Copyright © 2026 (Z) Programing  - *
+#                  *    -  -  All Rights Reserved  -  -    *
+#                  * * * * * * * * * * * * * * * * * * * * *
+"""
+Build-time script: parse .env once and generate app/_env_snapshot.py.
+
+At runtime QtAppContext loads ENV_SNAPSHOT instead of re-parsing .env.
+When the snapshot is absent (dev mode) it falls back to load_dotenv().
+Run: pixi run compile-env
+"""
+
+import sys
+from pathlib import Path
+
+from dotenv import dotenv_values
+
+
+def main():
+    projectRoot = Path(__file__).parent.parent
+    envPath = projectRoot / '.env'
+    snapshotPath = projectRoot / 'app' / '_env_snapshot.py'
+    if not envPath.exists():
+        print(f'[compile_env] No .env found: {envPath}')
+        print('[compile_env] Skipping snapshot generation.')
+        return
+    try:
+        values = {k: v for k, v in dotenv_values(envPath).items() if v is not None}
+    except Exception as e:
+        print(f'  ERROR parsing {envPath.name}: {e}', file=sys.stderr)
+        sys.exit(1)
+    lines = ['# Auto-generated by scripts/compile_env.py', '# Do NOT edit manually — run: pixi run compile-env', '', 'ENV_SNAPSHOT = {']
+    for key, value in values.items():
+        lines.append(f'    {key!r}: {value!r},')
+    lines.append('}')
+    lines.append('')
+    snapshotPath.write_text('\n'.join(lines), encoding='utf-8')
+    print(f'[compile_env] Generated {snapshotPath} with {len(values)} variable(s)')
+
+
+if __name__ == '__main__':
+    main()
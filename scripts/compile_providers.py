@@ -15,6 +15,8 @@
 Build-time script: scan app/providers/ and generate _provider_manifest.py.
 
 Uses AST parsing to find ServiceProvider subclasses without importing them.
+Each entry is emitted pre-validated as (module, className, deps) so the runtime
+can skip the subclass check; deps is None when after/requires/wants are not literals.
 Run: pixi run compile-providers
 """
 
@@ -23,9 +25,36 @@ import sys
 from pathlib import Path
 
 
+_DEP_FIELDS = ('after', 'requires', 'wants')
+# Marks an assignment form the compiler cannot evaluate statically
+_UNKNOWN = object()
+
+
+def _iterClassAssignments(classNode: ast.ClassDef):
+    """Yield (name, valueNode) for each class-level binding of a plain name.
+    Handles `x = ...`, `x = y = ...` and annotated `x: T = ...`; annotation-only
+    declarations bind nothing. Any other form that rebinds a name (augmented or
+    unpacking assignment) yields _UNKNOWN as its value.
+    """
+    for item in classNode.body:
+        if isinstance(item, ast.Assign):
+            for target in item.targets:
+                if isinstance(target, ast.Name):
+                    yield target.id, item.value
+                else:
+                    for sub in ast.walk(target):
+                        if isinstance(sub, ast.Name):
+                            yield sub.id, _UNKNOWN
+        elif isinstance(item, ast.AnnAssign):
+            if isinstance(item.target, ast.Name) and item.value is not None:
+                yield item.target.id, item.value
+        elif isinstance(item, ast.AugAssign) and isinstance(item.target, ast.Name):
+            yield item.target.id, _UNKNOWN
+
+
 def findProviderClasses(filePath: Path) -> list:
     """Parse a Python file and find classes that subclass ServiceProvider.
-    Returns list of tuples: (className, discoverable)
+    Returns list of tuples: (className, deps)
     """
     source = filePath.read_text(encoding='utf-8')
     tree = ast.parse(source, filename=str(filePath))
@@ -46,16 +75,24 @@ def findProviderClasses(filePath: Path) -> list:
                 break
         if not isProvider:
             continue
-        # Check discoverable attribute (default True)
+        # Check discoverable attribute (default True) and collect declared deps
         discoverable = True
-        for item in node.body:
-            if isinstance(item, ast.Assign):
-                for target in item.targets:
-                    if isinstance(target, ast.Name) and target.id == 'discoverable':
-                        if isinstance(item.value, ast.Constant):
-                            discoverable = item.value.value
+        deps = []
+        for name, value in _iterClassAssignments(node):
+            if name == 'discoverable':
+                if isinstance(value, ast.Constant):
+                    discoverable = value.value
+            elif name in _DEP_FIELDS and deps is not None:
+                if value is _UNKNOWN:
+                    deps = None
+                    continue
+                try:
+                    deps.extend(ast.literal_eval(value))
+                except (ValueError, TypeError, SyntaxError):
+                    # Computed value — leave resolution to runtime
+                    deps = None
         if discoverable:
-            providers.append(node.name)
+            providers.append((node.name, tuple(dict.fromkeys(deps)) if deps is not None else None))
     return providers
 
 
@@ -72,18 +109,16 @@ def main():
             continue
         moduleName = f'app.providers.{pyFile.stem}'
         try:
-            classNames = findProviderClasses(pyFile)
-            for className in classNames:
-                fqn = f'{moduleName}.{className}'
-                allProviders.append(fqn)
-                print(f'  Found: {fqn}')
+            for className, deps in findProviderClasses(pyFile):
+                allProviders.append((moduleName, className, deps))
+                print(f'  Found: {moduleName}.{className}')
         except Exception as e:
             print(f'  ERROR parsing {pyFile.name}: {e}', file=sys.stderr)
     # Write manifest
     manifestPath = providersDir / '_provider_manifest.py'
     lines = ['# Auto-generated by scripts/compile_providers.py', '# Do NOT edit manually — run: pixi run compile-providers', '', 'PROVIDERS = [']
-    for fqn in allProviders:
-        lines.append(f"    '{fqn}',")
+    for entry in allProviders:
+        lines.append(f'    {entry!r},')
     lines.append(']')
     lines.append('')
     manifestPath.write_text('\n'.join(lines), encoding='utf-8')
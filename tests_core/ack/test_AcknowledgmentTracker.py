@@ -0,0 +1,253 @@
+"""
+Tests for AcknowledgmentTracker and AcknowledgmentReceiver.
+"""
+
+#                  M""""""""`M            dP
+#                  Mmmmmm   .M            88
+#                  MMMMP  .MMM  dP    dP  88  .dP   .d8888b.
+#                  MMP  .MMMMM  88    88  88888"    88'  `88
+#                  M' .MMMMMMM  88.  .88  88  `8b.  88.  .88
+#                  M         M  `88888P'  dP   `YP  `88888P'
+#                  MMMMMMMMMMM    -*-  Created by Zuko  -*-
+#
+#                  * * * * * * * * * * * * * * * * * * * * *
+#                  * -    - -   F.R.E.E.M.I.N.D   - -    - *
+#                  * -  Copyright © 2026 (Z) Programing  - *
+#                  *    -  -  All Rights Reserved  -  -    *
+#                  * * * * * * * * * * * * * * * * * * * * *
+import threading
+import time
+
+import pytest
+
+from core.ack import AcknowledgmentReceiver, AcknowledgmentTracker
+
+
+class DummyReceiver(AcknowledgmentReceiver):
+    def _do_emit_event(self, eventName: str, ackId: str, **kwargs) -> None:
+        pass
+
+
+def test_wait_idle_returns_immediately_when_nothing_pending():
+    """An empty tracker is idle."""
+    tracker = AcknowledgmentTracker()
+    assert tracker.waitIdle(0) is True
+
+
+def test_wait_idle_times_out_while_pending():
+    """waitIdle returns False while an ack is outstanding."""
+    tracker = AcknowledgmentTracker()
+    tracker.registerPending('ack_1', lambda ackId, result: None, timeout=0)
+    assert tracker.waitIdle(0.05) is False
+    tracker.acknowledge('ack_1')
+    assert tracker.waitIdle(0) is True
+
+
+def test_wait_idle_after_error_and_clear():
+    """Error acks and clearAll both leave the tracker idle."""
+    tracker = AcknowledgmentTracker()
+    tracker.registerPending('ack_1', lambda ackId, result: None, timeout=0)
+    tracker.registerPending('ack_2', lambda ackId, result: None, timeout=0)
+    tracker.acknowledgeError('ack_1', RuntimeError('boom'))
+    assert tracker.waitIdle(0) is False
+    tracker.clearAll()
+    assert tracker.waitIdle(0) is True
+
+
+def test_timeout_sets_idle():
+    """An expired ack fires its timeout callback and releases waiters."""
+    tracker = AcknowledgmentTracker()
+    timedOut = []
+    tracker.registerPending('ack_1', lambda ackId, result: None, timeoutCallback=timedOut.append, timeout=0.05)
+    assert tracker.waitIdle(2.0) is True
+    assert timedOut == ['ack_1']
+
+
+def test_wait_for_acknowledgments_wakes_on_last_ack():
+    """The receiver returns as soon as the last ack arrives, not on a poll tick."""
+    receiver = DummyReceiver()
+    ackIds = [receiver.emitEventWithAck('evt', timeout=0) for _ in range(3)]
+
+    def sendAll():
+        for ackId in ackIds:
+            receiver._ack_tracker.acknowledge(ackId, ackId.upper())
+
+    threading.Timer(0.05, sendAll).start()
+    start = time.monotonic()
+    assert receiver.waitForAcknowledgments(timeout=2.0) is True
+    assert time.monotonic() - start < 1.0
+    assert [receiver.getAckResult(ackId) for ackId in ackIds] == [ackId.upper() for ackId in ackIds]
+
+
+def test_wait_for_acknowledgments_timeout():
+    """The receiver reports False when acks never arrive."""
+    receiver = DummyReceiver()
+    receiver.emitEventWithAck('evt', timeout=0)
+    assert receiver.waitForAcknowledgments(timeout=0.05) is False
+
+
+def test_timeouts_share_one_scheduler_thread():
+    """Many pending acks do not spawn a thread each; the scheduler exits once drained."""
+    tracker = AcknowledgmentTracker()
+    timedOut = []
+    before = threading.active_count()
+    for i in range(50):
+        tracker.registerPending(f'ack_{i}', lambda ackId, result: None, timeoutCallback=timedOut.append, timeout=0.05 + i * 0.001)
+    assert threading.active_count() <= before + 1
+    assert tracker.waitIdle(2.0) is True
+    assert timedOut == [f'ack_{i}' for i in range(50)]
+    deadline = time.monotonic() + 2.0
+    while tracker._timeoutThread is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert tracker._timeoutThread is None
+
+
+def test_acknowledged_entry_does_not_time_out_reregistration():
+    """A stale heap entry from an acked id never expires a later registration of that id."""
+    tracker = AcknowledgmentTracker()
+    timedOut = []
+    tracker.registerPending('ack_1', lambda ackId, result: None, timeoutCallback=timedOut.append, timeout=0.05)
+    tracker.acknowledge('ack_1')
+    tracker.registerPending('ack_1', lambda ackId, result: None, timeoutCallback=timedOut.append, timeout=5.0)
+    time.sleep(0.15)
+    assert timedOut == []
+    assert tracker.isPending('ack_1')
+    tracker.clearAll()
+
+
+def test_concurrent_register_and_acknowledge_across_shards():
+    """Parallel producers on distinct ids leave the tracker consistent and idle."""
+    tracker = AcknowledgmentTracker()
+    received = []
+
+    def worker(prefix):
+        for i in range(200):
+            ackId = f'{prefix}_{i}'
+            tracker.registerPending(ackId, lambda ackId, result: received.append(ackId), timeout=0)
+            tracker.acknowledge(ackId)
+
+    threads = [threading.Thread(target=worker, args=(f't{n}',)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert tracker.pendingCount() == 0
+    assert tracker.getAllPendingIds() == []
+    assert tracker.waitIdle(0) is True
+    assert len(received) == 1600
+
+
+def test_generate_ack_id_format():
+    """Ack ids are ack_<22 hex chars> and do not repeat."""
+    receiver = DummyReceiver()
+    ackIds = {receiver.generateAckId() for _ in range(1000)}
+    assert len(ackIds) == 1000
+    for ackId in ackIds:
+        assert ackId.startswith('ack_') and len(ackId) == 26
+        int(ackId[4:], 16)
+
+
+def test_generate_ack_id_unique_across_threads():
+    """Each thread draws from its own lane, so concurrent ids never collide."""
+    receiver = DummyReceiver()
+    results = []
+
+    def worker():
+        results.append([receiver.generateAckId() for _ in range(500)])
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    ackIds = [ackId for batch in results for ackId in batch]
+    assert len(set(ackIds)) == len(ackIds) == 4000
+
+
+def test_register_pending_batch_is_all_or_nothing():
+    """A clash with an already pending id leaves the batch unregistered."""
+    tracker = AcknowledgmentTracker()
+    noop = lambda ackId, result: None  # noqa: E731
+    tracker.registerPending('ack_3', noop, timeout=0)
+    with pytest.raises(ValueError):
+        tracker.registerPendingBatch([(f'ack_{i}', noop, None, None, 0) for i in range(5)])
+    assert tracker.getAllPendingIds() == ['ack_3']
+    with pytest.raises(ValueError):
+        tracker.registerPendingBatch([('ack_9', noop, None, None, 0), ('ack_9', noop, None, None, 0)])
+    assert tracker.pendingCount() == 1
+
+
+def test_register_pending_batch_schedules_timeouts():
+    """Batched acks time out through the shared scheduler like single ones."""
+    tracker = AcknowledgmentTracker()
+    timedOut = []
+    tracker.registerPendingBatch([(f'ack_{i}', lambda ackId, result: None, None, timedOut.append, 0.05) for i in range(20)])
+    assert tracker.pendingCount() == 20
+    assert tracker.waitIdle(2.0) is True
+    assert sorted(timedOut) == sorted(f'ack_{i}' for i in range(20))
+
+
+def test_emit_events_with_ack():
+    """Batch emit returns ids in event order and fails unsent events on error."""
+
+    class FailingReceiver(AcknowledgmentReceiver):
+        def __init__(self):
+            super().__init__()
+            self.emitted = []
+            self.errors = []
+
+        def _do_emit_event(self, eventName, ackId, **kwargs):
+            if eventName == 'bad':
+                raise RuntimeError('emit failed')
+            self.emitted.append((eventName, ackId, kwargs))
+
+        def _on_ack_error(self, ackId, error):
+            self.errors.append(ackId)
+
+    receiver = FailingReceiver()
+    ackIds = receiver.emitEventsWithAck([('a', {'x': 1}), ('b', {})], timeout=0)
+    assert [(name, ackId) for name, ackId, _ in receiver.emitted] == list(zip(['a', 'b'], ackIds))
+    assert receiver.emitted[0][2] == {'x': 1}
+    assert receiver.pendingAckCount() == 2
+    with pytest.raises(RuntimeError):
+        receiver.emitEventsWithAck([('c', {}), ('bad', {}), ('d', {})], timeout=0)
+    assert len(receiver.errors) == 2
+    assert receiver.pendingAckCount() == 3
+
+
+def test_cleanup_expired_only_fires_expired():
+    """Manual cleanup fires overdue acks and leaves the rest pending."""
+    tracker = AcknowledgmentTracker()
+    timedOut = []
+    # timeout=0 has no scheduler entry, so only the manual sweep can expire it
+    tracker.registerPending('old', lambda ackId, result: None, timeoutCallback=timedOut.append, timeout=0)
+    tracker.registerPending('fresh', lambda ackId, result: None, timeoutCallback=timedOut.append, timeout=60.0)
+    tracker.cleanupExpired()
+    assert timedOut == ['old']
+    assert tracker.getAllPendingIds() == ['fresh']
+    tracker.clearAll()
+
+
+def test_racing_acknowledges_fire_exactly_once():
+    """Concurrent acknowledge/acknowledgeError on the same ids deliver one callback per id."""
+    tracker = AcknowledgmentTracker()
+    fired = []
+    ackIds = [f'ack_{i}' for i in range(300)]
+    for ackId in ackIds:
+        tracker.registerPending(ackId, lambda ackId, result: fired.append(ackId), errorCallback=lambda ackId, error: fired.append(ackId), timeout=0)
+
+    def ackAll(useError):
+        for ackId in ackIds:
+            if useError:
+                tracker.acknowledgeError(ackId, RuntimeError('late'))
+            else:
+                tracker.acknowledge(ackId)
+
+    threads = [threading.Thread(target=ackAll, args=(n % 2 == 1,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(fired) == sorted(ackIds)
+    assert tracker.pendingCount() == 0
+    assert tracker.waitIdle(0) is True
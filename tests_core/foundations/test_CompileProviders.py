@@ -0,0 +1,79 @@
+#                  M"""""""`M            dP
+#                  Mmmmmm   .M            88
+#                  MMMMP  .MMM  dP    dP  88  .dP   .d8888b.
+#                  MMP  .MMMMM  88    88  88888"    88'  `88
+#                  M' .MMMMMMM  88.  .88  88  `8b.  88.  .88
+#                  M         M  `88888P'  dP   `YP  `88888P'
+#                  MMMMMMMMMMM    -*-  Created by Zuko  -*-
+#
+#                  * * * * * * * * * * * * * * * * * * * * *
+#                  * -    - -   F.R.E.E.M.I.N.D   - -    - *
+#                  * -  Copyright © 2026 (Z) Programing  - *
+#                  *    -  -  All Rights Reserved  -  -    *
+#                  * * * * * * * * * * * * * * * * * * * * *
+"""Unit tests for scripts/compile_providers.py — AST-only, nothing is imported."""
+
+import textwrap
+
+from scripts.compile_providers import findProviderClasses
+
+
+def _compile(tmp_path, source):
+    path = tmp_path / 'SampleProvider.py'
+    path.write_text(textwrap.dedent(source), encoding='utf-8')
+    return dict(findProviderClasses(path))
+
+
+def test_annotated_deps_are_collected(tmp_path):
+    providers = _compile(
+        tmp_path,
+        """
+        from typing import List
+        from core.contracts.ServiceProvider import ServiceProvider
+
+        class AProvider(ServiceProvider):
+            requires: List[str] = ['BProvider']
+            after: List[str] = ['CProvider', 'BProvider']
+            wants: List[str]
+        """,
+    )
+    assert providers == {'AProvider': ('BProvider', 'CProvider')}
+
+
+def test_plain_assignment_deps_are_collected(tmp_path):
+    providers = _compile(
+        tmp_path,
+        """
+        class AProvider(ServiceProvider):
+            after = ['BProvider']
+        """,
+    )
+    assert providers == {'AProvider': ('BProvider',)}
+
+
+def test_annotated_discoverable_false_is_skipped(tmp_path):
+    providers = _compile(
+        tmp_path,
+        """
+        class AProvider(ServiceProvider):
+            discoverable: bool = False
+        """,
+    )
+    assert providers == {}
+
+
+def test_unevaluable_forms_defer_to_runtime(tmp_path):
+    providers = _compile(
+        tmp_path,
+        """
+        class AProvider(ServiceProvider):
+            requires: List[str] = computeDeps()
+
+        class BProvider(ServiceProvider):
+            after, requires = ['X'], ['Y']
+
+        class CProvider(ServiceProvider):
+            wants += ['X']
+        """,
+    )
+    assert providers == {'AProvider': None, 'BProvider': None, 'CProvider': None}
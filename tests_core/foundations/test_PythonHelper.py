@@ -0,0 +1,52 @@
+"""
+Unit tests for core.Utils.PythonHelper.dataclass2Json – orjson and stdlib paths.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+import pytest
+
+import core.Utils
+from core.Utils import PythonHelper
+
+
+@dataclass
+class Inner:
+    name: str = 'inner'
+    tags: List[str] = field(default_factory=lambda: ['a', 'ü'])
+
+
+@dataclass
+class Outer:
+    id: int = 1
+    ratio: float = 0.5
+    inner: Inner = field(default_factory=Inner)
+    children: List[Inner] = field(default_factory=lambda: [Inner('x', []), Inner('y')])
+    meta: Dict[str, int] = field(default_factory=lambda: {'k': 2})
+
+
+def _stdlibJson(monkeypatch, obj, extra=None):
+    monkeypatch.setattr(core.Utils, 'orjson', None)
+    try:
+        return PythonHelper.dataclass2Json(obj, extra)
+    finally:
+        monkeypatch.undo()
+
+
+def test_orjson_and_stdlib_paths_match_on_nested_dataclass(monkeypatch):
+    pytest.importorskip('orjson')
+    obj = Outer()
+    assert PythonHelper.dataclass2Json(obj) == _stdlibJson(monkeypatch, obj)
+    extra = {'extra': True}
+    assert PythonHelper.dataclass2Json(obj, extra) == _stdlibJson(monkeypatch, obj, extra)
+
+
+def test_int_beyond_64_bits_falls_back_to_stdlib(monkeypatch):
+    obj = Outer(id=2**70)
+    assert PythonHelper.dataclass2Json(obj) == _stdlibJson(monkeypatch, obj)
+
+
+def test_rejects_non_dataclass():
+    with pytest.raises(TypeError):
+        PythonHelper.dataclass2Json({'a': 1})
@@ -0,0 +1,109 @@
+#                  M"""""""`M            dP
+#                  Mmmmmm   .M            88
+#                  MMMMP  .MMM  dP    dP  88  .dP   .d8888b.
+#                  MMP  .MMMMM  88    88  88888"    88'  `88
+#                  M' .MMMMMMM  88.  .88  88  `8b.  88.  .88
+#                  M         M  `88888P'  dP   `YP  `88888P'
+#                  MMMMMMMMMMM    -*-  Created by Zuko  -*-
+#
+#                  * * * * * * * * * * * * * * * * * * * * *
+#                  * -    - -   F.R.E.E.M.I.N.D   - -    - *
+#                  * -  Copyright © 2026 (Z) Programing  - *
+#                  *    -  -  All Rights Reserved  -  -    *
+#                  * * * * * * * * * * * * * * * * * * * * *
+"""Unit tests for the QtAppContext.bootstrap() once-gate — the real bootstrap body is stubbed."""
+
+import importlib
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from core.NetworkManager import NetworkManager
+from core.QtAppContext import QtAppContext
+from core.ServiceLocator import ServiceLocator
+
+# core/__init__ re-exports the class under the submodule's name; fetch the module itself
+qtAppContextModule = importlib.import_module('core.QtAppContext')
+
+
+def _makeContext(runBootstrap):
+    """A stand-in carrying only the state bootstrap() touches."""
+    return SimpleNamespace(_bootLock=threading.Lock(), _bootFuture=None, _bootThreadId=None, _runBootstrap=runBootstrap)
+
+
+def test_waiter_sees_failure_and_next_call_retries():
+    started = threading.Event()
+    release = threading.Event()
+    attempts = []
+
+    def runBootstrap():
+        attempts.append(1)
+        if len(attempts) == 1:
+            started.set()
+            release.wait(2.0)
+            raise RuntimeError('boot failed')
+
+    ctx = _makeContext(runBootstrap)
+    runnerErrors, waiterErrors = [], []
+
+    def call(errors):
+        try:
+            QtAppContext.bootstrap(ctx)
+        except RuntimeError as e:
+            errors.append(e)
+
+    runner = threading.Thread(target=call, args=(runnerErrors,))
+    runner.start()
+    assert started.wait(2.0)
+    waiter = threading.Thread(target=call, args=(waiterErrors,))
+    waiter.start()
+    waiter.join(0.1)
+    # The waiter must still be blocked on the in-flight attempt
+    assert waiter.is_alive()
+    release.set()
+    runner.join(2.0)
+    waiter.join(2.0)
+    assert [str(e) for e in runnerErrors] == ['boot failed']
+    assert [str(e) for e in waiterErrors] == ['boot failed']
+    # Gate reopened: a later call runs a fresh attempt and succeeds
+    assert QtAppContext.bootstrap(ctx) is ctx
+    assert len(attempts) == 2
+    assert QtAppContext.bootstrap(ctx) is ctx
+    assert len(attempts) == 2
+
+
+def test_reentrant_call_from_booting_thread_does_not_block():
+    ctx = _makeContext(lambda: QtAppContext.bootstrap(ctx))
+    assert QtAppContext.bootstrap(ctx) is ctx
+
+
+def test_failure_propagates_to_runner():
+    def runBootstrap():
+        raise ValueError('nope')
+
+    ctx = _makeContext(runBootstrap)
+    with pytest.raises(ValueError):
+        QtAppContext.bootstrap(ctx)
+    assert ctx._bootThreadId is None
+
+
+def test_lazy_network_service_resolves_by_type_before_name(monkeypatch):
+    guiThread = object()
+
+    class FakeNetworkManager:
+        def __init__(self, config):
+            self.config = config
+
+        def thread(self):
+            return guiThread
+
+    monkeypatch.setattr(qtAppContextModule, 'NetworkManager', FakeNetworkManager)
+    ctx = SimpleNamespace(_config=object(), _app=SimpleNamespace(thread=lambda: guiThread), _networkManager=None)
+    services = ServiceLocator()
+    # Same registration bootstrap() performs for the 'network' feature
+    services.registerFactory('network', QtAppContext._createNetworkManager.__get__(ctx))
+    manager = services.get(NetworkManager)
+    assert isinstance(manager, FakeNetworkManager)
+    assert services.get('network') is manager
+    assert ctx._networkManager is manager
@@ -113,6 +113,22 @@ class TestScopedServices:
         self.sl.releaseScope(self.tag)
         assert DummyServiceB.cleanedUp is True
 
+    def test_release_scope_disposer_priority_per_instance(self):
+        calls = []
+
+        class Closable:
+            def close(self):
+                calls.append('close')
+
+            def dispose(self):
+                calls.append('dispose')
+
+        # Two instances of the same type: the second hits the memoized disposer
+        self.sl.registerScoped(self.tag, Closable())
+        self.sl.registerScoped(self.tag, Closable())
+        self.sl.releaseScope(self.tag)
+        assert calls == ['close', 'close']
+
     def test_release_scope_removes_tag(self):
         self.sl.registerScoped(self.tag, DummyServiceA())
         self.sl.releaseScope(self.tag)
@@ -120,3 +136,62 @@ class TestScopedServices:
 
     def test_release_nonexistent_tag_is_noop(self):
         self.sl.releaseScope('no-such-tag')
+
+
+# ---------------------------------------------------------------------------
+# Lazy singletons – registerFactory
+# ---------------------------------------------------------------------------
+
+
+class TestFactoryServices:
+    def setup_method(self):
+        self.sl = ServiceLocator()
+
+    def test_factory_runs_once_on_first_get(self):
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return DummyServiceA()
+
+        self.sl.registerFactory('lazy_a', factory)
+        assert calls == []
+        first = self.sl.get('lazy_a')
+        assert isinstance(first, DummyServiceA)
+        assert self.sl.get('lazy_a') is first
+        assert calls == [1]
+
+    def test_factory_string_key_also_resolves_by_type(self):
+        self.sl.registerFactory('lazy_a', DummyServiceA)
+        svc = self.sl.get('lazy_a')
+        assert self.sl.get(DummyServiceA) is svc
+
+    def test_factory_string_key_resolves_by_declared_type_first(self):
+        def createService() -> DummyServiceA:
+            return DummyServiceA()
+
+        self.sl.registerFactory('lazy_a', createService)
+        svc = self.sl.get(DummyServiceA)
+        assert isinstance(svc, DummyServiceA)
+        assert self.sl.get('lazy_a') is svc
+
+    def test_factory_by_class(self):
+        self.sl.registerFactory(DummyServiceC, DummyServiceC)
+        assert isinstance(self.sl.get(DummyServiceC), DummyServiceC)
+
+    def test_missing_key_returns_default_without_factory(self):
+        sentinel = object()
+        assert self.sl.get('nope', sentinel) is sentinel
+
+
+class TestRegisterMany:
+    def setup_method(self):
+        self.sl = ServiceLocator()
+
+    def test_register_many_by_string_and_type(self):
+        svcA = DummyServiceA()
+        svcC = DummyServiceC()
+        self.sl.registerMany({'svc_a': svcA, DummyServiceC: svcC})
+        assert self.sl.get('svc_a') is svcA
+        assert self.sl.get(DummyServiceA) is svcA
+        assert self.sl.get(DummyServiceC) is svcC
@@ -210,3 +210,23 @@ def test_daemonWorkerRejectsNonMessageItems(qtbot, pub):
         worker.enqueue(('tuple', 'item'))  # not a Message — must raise
     # Valid Message must NOT raise
     worker.enqueue(Message(topic='test', payload={}))
+
+
+@pytest.mark.qt
+def test_connectForwardsSignalArgs(qtbot, pub):
+    """connect() must forward bound args first, then signal args, merging kwargs."""
+    from PySide6.QtCore import QObject, Signal
+    class _Emitter(QObject):
+        changed = Signal(int)
+    emitter = _Emitter()
+    calls = []
+    originalNotify = pub.notify
+    pub.notify = lambda event, *a, **kw: calls.append((event, a, kw))
+    try:
+        pub.connect(emitter, 'changed', 'plainEvent')
+        pub.connect(emitter, 'changed', 'boundEvent', 'prefix', source='spin')
+        emitter.changed.emit(7)
+    finally:
+        pub.notify = originalNotify
+    assert ('plainEvent', (7,), {}) in calls
+    assert ('boundEvent', ('prefix', 7), {'source': 'spin'}) in calls
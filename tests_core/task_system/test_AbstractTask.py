@@ -15,6 +15,8 @@ Tests for AbstractTask base class.
 #                  * -  Copyright © 2026 (Z) Programing  - *
 #                  *    -  -  All Rights Reserved  -  -    *
 #                  * * * * * * * * * * * * * * * * * * * * *
+import threading
+
 import pytest
 
 #
@@ -76,6 +78,17 @@ def test_set_progress(qtbot):
     assert task.progress == 50
 
 
+def test_set_progress_skips_unchanged():
+    """Test that repeating the same progress/label does not re-emit."""
+    task = ConcreteTask(name='Test')
+    emitted = []
+    task.progressUpdated.connect(lambda uuid, pct, label: emitted.append((pct, label)))
+    task.setProgress(40)
+    task.setProgress(40)
+    task.setProgress(40, 'step')
+    assert emitted == [(40, ''), (40, 'step')]
+
+
 def test_progress_clamping():
     """Test that progress is clamped to 0-100."""
     task = ConcreteTask(name='Test')
@@ -145,3 +158,14 @@ def test_run_with_cancellation(qtbot):
     with qtbot.waitSignal(task.taskFinished, timeout=2000):
         task.run()
     assert task.status == TaskStatus.CANCELLED
+
+
+def test_signals_first_read_on_worker_belong_to_app_thread(qapp):
+    """TaskSignals created lazily on a worker thread must live on the application thread."""
+    task = ConcreteTask(name='Worker Task')
+    seen = []
+    worker = threading.Thread(target=lambda: seen.append(task.signals))
+    worker.start()
+    worker.join(2.0)
+    assert seen and seen[0] is task.signals
+    assert task.signals.thread() == qapp.thread()
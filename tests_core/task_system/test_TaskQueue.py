@@ -76,6 +76,15 @@ def test_set_max_concurrent_tasks(task_tracker, mock_config):
     assert queue._threadPool.maxThreadCount() == 5
 
 
+def test_set_max_concurrent_tasks_auto(task_tracker, mock_config):
+    """Test 'auto' sizes the pool to the host's ideal thread count."""
+    from PySide6.QtCore import QThread
+    queue = TaskQueue(task_tracker, mock_config, mock_config, maxConcurrentTasks=3)
+    queue.setMaxConcurrentTasks('auto')
+    assert queue._maxConcurrentTasks == QThread.idealThreadCount()
+    assert queue._threadPool.maxThreadCount() == QThread.idealThreadCount()
+
+
 def test_set_invalid_max_concurrent_tasks(task_tracker, mock_config, caplog_loguru):
     """Test setting invalid max concurrent tasks."""
     with caplog_loguru.at_level(logging.WARNING):